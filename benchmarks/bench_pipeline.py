@@ -0,0 +1,155 @@
+"""Wall time and peak memory of every report stage, compared against a stored baseline
+
+Usage: python benchmarks/bench_pipeline.py [--rows N ...] [--encodings E ...]
+                                            [--years N] [--save-baseline] [--tolerance X]
+
+Synthetic timelog.csv and issues.csv exports of each size and encoding are
+generated into a temporary directory and run through read_csv_file,
+extract_data_from_this_week, process_data, merge_raws, print_output and
+print_eow_summary with a cold cache. Every stage is timed on its own, then
+run again under tracemalloc for its peak memory. Stage timings are the
+best of three runs.
+
+Results are compared with benchmarks/baseline.json; stages slower or
+bigger than the baseline by more than the tolerance are reported and the
+exit status is 1. --save-baseline records the current run instead.
+"""
+import argparse
+import contextlib
+import functools
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main  # noqa: E402
+from synthetic import USERS, write_export  # noqa: E402
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+DEFAULT_ROWS = [1_000, 10_000, 100_000]
+DEFAULT_ENCODINGS = ['utf-8', 'cp1252']
+# Each stage is timed this many times and the fastest run is kept
+REPEAT = 3
+# Differences below these floors are noise and never count as regressions
+MIN_SECONDS = 0.02
+MIN_PEAK_BYTES = 1024 * 1024
+
+
+def measure(func, *args):
+    """Time the best of REPEAT runs of func, then run it under tracemalloc for peak bytes"""
+    elapsed = float('inf')
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = min(elapsed, time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def run_pipeline(tmp, rows, encoding, years):
+    """Time every stage on fresh exports of one size and encoding; returns {stage: (seconds, bytes)}"""
+    results = {}
+    weeks = []
+    raws = []
+    for kind in ('timelog', 'issues'):
+        path = os.path.join(tmp, f'{kind}-{rows}-{encoding}.csv')
+        write_export(path, rows, kind=kind, encoding=encoding, days=365 * years, users=USERS)
+
+        def read(path=path):
+            main.clear_cache()
+            return main.read_csv_file(path)
+
+        df, *results[f'{kind}/read_csv_file'] = measure(read)
+        week, *results[f'{kind}/extract_data_from_this_week'] = measure(
+            lambda: main.extract_data_from_this_week(df.copy()))
+        raw, *results[f'{kind}/process_data'] = measure(lambda: main.process_data(week.copy()))
+        weeks.append(week)
+        raws.append(raw)
+
+    merged, *results['merge_raws'] = measure(main.merge_raws, *raws)
+    _, *results['print_output'] = measure(main.print_output, merged)
+    _, *results['print_eow_summary'] = measure(main.print_eow_summary, weeks[0])
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Print every stage next to its baseline and return the regressed ones"""
+    regressions = []
+    print(f"{'case':<34} {'stage':<38} {'seconds':>8} {'base':>8} {'peak MB':>8} {'base':>8}")
+    for case, stages in results.items():
+        for stage, (seconds, peak) in stages.items():
+            base_seconds, base_peak = baseline.get(case, {}).get(stage, (None, None))
+            flag = ''
+            if base_seconds is not None:
+                slower = seconds > max(base_seconds, MIN_SECONDS) * tolerance
+                bigger = peak > max(base_peak, MIN_PEAK_BYTES) * tolerance
+                if slower or bigger:
+                    flag = ' REGRESSION'
+                    regressions.append((case, stage))
+            print(f"{case:<34} {stage:<38} {seconds:>8.3f} {_fmt(base_seconds, 1, '.3f')} "
+                  f"{peak / 1e6:>8.1f} {_fmt(base_peak, 1e6, '.1f')}{flag}")
+    return regressions
+
+
+def _fmt(value, scale, spec):
+    return f"{'-':>8}" if value is None else f"{value / scale:>8{spec}}"
+
+
+def run(rows_list, encodings, years, save_baseline, tolerance):
+    main.console.quiet = True
+    # The clipboard is an OS round trip unrelated to the pipeline, so reports are only rendered
+    main.ReportWriter = functools.partial(main.ReportWriter, to_clipboard=False)
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        main.CACHE_DIR = os.path.join(tmp, 'cache')
+        main.INDEX_DIR = os.path.join(main.CACHE_DIR, 'index')
+        for rows in rows_list:
+            for encoding in encodings:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    results[f'rows={rows} encoding={encoding} years={years}'] = run_pipeline(
+                        tmp, rows, encoding, years)
+
+    if save_baseline:
+        baseline = {}
+        if os.path.exists(BASELINE_PATH):
+            with open(BASELINE_PATH) as f:
+                baseline = json.load(f)
+        baseline.update(results)
+        with open(BASELINE_PATH, 'w') as f:
+            json.dump(baseline, f, indent=1, sort_keys=True)
+        print(f"Baseline saved to {BASELINE_PATH}")
+        return 0
+
+    baseline = {}
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH) as f:
+            baseline = json.load(f)
+    regressions = compare(results, baseline, tolerance)
+    if regressions:
+        print(f"\n{len(regressions)} stage(s) regressed by more than {tolerance:.2f}x")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark every report stage on synthetic exports")
+    parser.add_argument('--rows', type=int, nargs='+', default=DEFAULT_ROWS,
+                        help="Export sizes, up to 10000000 (default: 1k 10k 100k)")
+    parser.add_argument('--encodings', nargs='+', default=DEFAULT_ENCODINGS)
+    parser.add_argument('--years', type=int, default=1, help="Years of history in each export")
+    parser.add_argument('--save-baseline', action='store_true', help="Record this run as the baseline")
+    parser.add_argument('--tolerance', type=float, default=1.5,
+                        help="Allowed slowdown or memory growth over the baseline (default: 1.5x)")
+    args = parser.parse_args()
+    sys.exit(run(args.rows, args.encodings, args.years, args.save_baseline, args.tolerance))
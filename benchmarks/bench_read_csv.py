@@ -0,0 +1,50 @@
+"""Bytes read from disk per ``read_csv_file`` call on large synthetic exports
+
+Usage: python benchmarks/bench_read_csv.py [rows ...]
+
+Reads are counted with the ``rchar`` field of /proc/self/io, so this is Linux only.
+"""
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main  # noqa: E402
+from synthetic import write_export  # noqa: E402
+
+
+def bytes_read():
+    with open('/proc/self/io') as f:
+        for line in f:
+            if line.startswith('rchar:'):
+                return int(line.split()[1])
+    raise RuntimeError('rchar not available')
+
+
+def run(rows_list):
+    main.console.quiet = True
+    print(f"{'rows':>10} {'encoding':>8} {'file MB':>9} {'read MB':>9} {'ratio':>6} {'seconds':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        main.CACHE_DIR = os.path.join(tmp, 'cache')
+        main.INDEX_DIR = os.path.join(main.CACHE_DIR, 'index')
+        for rows in rows_list:
+            for encoding in ('utf-8', 'cp1252'):
+                path = os.path.join(tmp, f'timelog-{rows}-{encoding}.csv')
+                size = write_export(path, rows, encoding=encoding)
+                before = bytes_read()
+                start = time.perf_counter()
+                with contextlib.redirect_stdout(io.StringIO()):
+                    df = main.read_csv_file(path)
+                elapsed = time.perf_counter() - start
+                read = bytes_read() - before
+                assert df is not None and len(df) == rows
+                print(f"{rows:>10} {encoding:>8} {size / 1e6:>9.1f} {read / 1e6:>9.1f} "
+                      f"{read / size:>6.2f} {elapsed:>8.2f}")
+
+
+if __name__ == '__main__':
+    run([int(arg) for arg in sys.argv[1:]] or [100_000, 1_000_000])
@@ -0,0 +1,114 @@
+"""Latency of ``main.py serve`` under simulated teammates and chat bots
+
+Usage: python benchmarks/bench_server.py [rows] [--clients N] [--rounds N]
+
+Starts the report server on synthetic exports and has every client request
+each report for a few users and weeks, round after round. The first round
+renders, later rounds should come from the memo. Then the timelog is grown
+and one more request checks that the server notices the change.
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic import USERS, write_export  # noqa: E402
+
+MAIN = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'main.py')
+
+
+async def get(port, target):
+    """Send one GET to the local server and return (status, body, seconds)"""
+    start = time.perf_counter()
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(f"GET {target} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, body = response.partition(b'\r\n\r\n')
+    return int(head.split()[1]), body.decode('utf-8'), time.perf_counter() - start
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+async def wait_until_up(port, server, timeout=300):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError('server exited during start-up')
+        try:
+            await get(port, '/health')
+            return
+        except OSError:
+            await asyncio.sleep(0.2)
+    raise TimeoutError('server did not come up')
+
+
+async def client(port, targets, rounds, latencies):
+    for round_number in range(rounds):
+        for target in targets:
+            status, body, seconds = await get(port, target)
+            assert status == 200, body
+            latencies.setdefault(round_number, []).append(seconds)
+
+
+def summary(seconds):
+    ordered = sorted(seconds)
+    p95 = ordered[int(len(ordered) * 0.95) - 1] if len(ordered) > 1 else ordered[0]
+    return f"median {statistics.median(ordered) * 1e3:7.1f} ms   p95 {p95 * 1e3:7.1f} ms   n={len(ordered)}"
+
+
+async def run(rows, clients, rounds):
+    this_year, this_week, _ = date.today().isocalendar()
+    weeks = [f"{this_year}-W{this_week:02d}", f"{this_year}-W{max(this_week - 1, 1):02d}"]
+    targets = [f"/{command}?week={week}&user={user.replace(' ', '%20').replace(',', '%2C')}&format=json"
+               for command in ('goals', 'compare', 'eow') for week in weeks for user in USERS[:2]]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        timelog = os.path.join(tmp, 'timelog.csv')
+        issues = os.path.join(tmp, 'issues.csv')
+        write_export(timelog, rows, kind='timelog')
+        write_export(issues, rows // 3, kind='issues')
+        port = free_port()
+        server = subprocess.Popen(
+            [sys.executable, MAIN, 'serve', '--port', str(port), '--timelog', timelog, '--issues', issues],
+            cwd=tmp, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            start = time.perf_counter()
+            await wait_until_up(port, server)
+            print(f"server up in {time.perf_counter() - start:.1f} s with {rows} timelog rows")
+
+            latencies = {}
+            await asyncio.gather(*(client(port, targets, rounds, latencies) for _ in range(clients)))
+            print(f"first round   {summary(latencies[0])}")
+            print(f"later rounds  {summary([s for r, values in latencies.items() if r for s in values])}")
+
+            with open(timelog, 'a', encoding='utf-8', newline='') as f:
+                f.write(open(timelog, encoding='utf-8').read().splitlines()[1] + '\n')
+            _, body, seconds = await get(port, targets[0])
+            print(f"after change  {seconds * 1e3:7.1f} ms   cached={json.loads(body)['cached']}")
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('rows', type=int, nargs='?', default=100_000)
+    parser.add_argument('--clients', type=int, default=8)
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(run(args.rows, args.clients, args.rounds))
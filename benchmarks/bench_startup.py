@@ -0,0 +1,69 @@
+"""Startup budget for main.py, measured with ``python -X importtime``
+
+Usage: python benchmarks/bench_startup.py [--budget-ms N]
+
+Exits non-zero when importing main takes longer than the budget or when a
+heavy dependency is imported eagerly.
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Cumulative import time of main, in milliseconds
+STARTUP_BUDGET_MS = 150
+# These must only load on first use
+LAZY_MODULES = ('pandas', 'numpy', 'rich', 'pyperclip', 'concurrent.futures', 'argparse')
+LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)')
+
+
+def import_profile():
+    """(self us, cumulative us, depth, module) for every import done by ``import main``"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import main'],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        match = LINE.match(line)
+        if match:
+            rows.append((int(match[1]), int(match[2]), len(match[3]), match[4]))
+    return rows
+
+
+def wall_time(args, repeat=5):
+    """Best wall time in milliseconds of running main.py with args"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, 'main.py', *args], cwd=ROOT, capture_output=True, check=True)
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def run(budget_ms):
+    rows = import_profile()
+    total_ms = next(cumulative for _, cumulative, _, name in rows if name == 'main') / 1e3
+    eager = sorted({name for _, _, _, name in rows if name.split('.')[0] in LAZY_MODULES or name in LAZY_MODULES})
+
+    print("Slowest imports (self time):")
+    for self_us, cumulative_us, _, name in sorted(rows, reverse=True)[:10]:
+        print(f"  {self_us / 1e3:>7.1f} ms  {cumulative_us / 1e3:>7.1f} ms  {name}")
+    print(f"import main: {total_ms:.1f} ms (budget {budget_ms} ms)")
+    print(f"main.py --help: {wall_time(['--help']):.1f} ms wall")
+
+    ok = total_ms <= budget_ms
+    if eager:
+        print(f"Imported eagerly: {', '.join(eager)}")
+        ok = False
+    print("OK" if ok else "OVER BUDGET")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--budget-ms', type=float, default=STARTUP_BUDGET_MS)
+    sys.exit(run(parser.parse_args().budget_ms))
@@ -0,0 +1,44 @@
+"""Week lookup time through the week index versus a full in-memory scan
+
+Usage: python benchmarks/bench_week_index.py [rows ...]
+"""
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main  # noqa: E402
+from synthetic import write_export  # noqa: E402
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def run(rows_list):
+    main.console.quiet = True
+    iso_year, iso_week, _ = date.today().isocalendar()
+    print(f"{'rows':>10} {'build s':>8} {'lookup ms':>10} {'scan ms':>9} {'week rows':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        main.CACHE_DIR = os.path.join(tmp, 'cache')
+        main.INDEX_DIR = os.path.join(main.CACHE_DIR, 'index')
+        for rows in rows_list:
+            path = os.path.join(tmp, f'timelog-{rows}.csv')
+            write_export(path, rows)
+            _, build = timed(main.update_week_index, path)
+            week_rows, lookup = timed(main.load_indexed_week, path, iso_year, iso_week)
+            with contextlib.redirect_stdout(io.StringIO()):
+                df = main.read_csv_file(path)
+            _, scan = timed(main.extract_data_from_this_week, df)
+            print(f"{rows:>10} {build:>8.2f} {lookup * 1e3:>10.1f} {scan * 1e3:>9.1f} {len(week_rows):>10}")
+
+
+if __name__ == '__main__':
+    run([int(arg) for arg in sys.argv[1:]] or [100_000, 1_000_000])
@@ -0,0 +1,140 @@
+"""Consistency checks between the report paths on synthetic exports
+
+Usage: python benchmarks/check_reports.py [rows]
+
+Every check runs ``main.py`` in a temporary directory and compares the
+reports that different paths produce for the same data. The exit status is
+1 when any check fails.
+"""
+import argparse
+import os
+import re
+import sqlite3
+import subprocess
+import sys
+import tempfile
+from datetime import date, timedelta
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic import USERS, write_export  # noqa: E402
+
+MAIN = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'main.py')
+
+
+def run_main(tmp, *args):
+    """One main.py run in tmp; a failed run fails the check"""
+    result = subprocess.run([sys.executable, MAIN, *args], cwd=tmp,
+                            capture_output=True, text=True, encoding='utf-8')
+    if result.returncode:
+        raise AssertionError(f"main.py {' '.join(args)} exited {result.returncode}: {result.stderr}")
+    return result
+
+
+def report(tmp, *args):
+    """The report one main.py run in tmp writes to stdout"""
+    return run_main(tmp, *args, '--quiet').stdout
+
+
+def check_reingest_after_edit(tmp, rows):
+    """Editing entries and ingesting the export again updates rows instead of adding them"""
+    timelog = os.path.join(tmp, 'timelog.csv')
+    db = os.path.join(tmp, 'check.sqlite3')
+    write_export(timelog, rows, kind='timelog')
+    run_main(tmp, 'ingest', '--input', timelog, '--db', db)
+
+    df = pd.read_csv(timelog, dtype=str, keep_default_na=False)
+    dates = pd.to_datetime(df['Date']).dt.isocalendar()
+    this_week = (dates['year'] == date.today().isocalendar()[0]) & (dates['week'] == date.today().isocalendar()[1])
+    edited = df.index[this_week][:5]
+    df.loc[edited, 'Level of Difficulty (Dev)'] = df.loc[edited, 'Level of Difficulty (Dev)'].map(
+        {'EASY': 'HARD', 'NORMAL': 'EASY', 'HARD': 'NORMAL'})
+    df.to_csv(timelog, index=False)
+    # Status messages, like what ingest changed, go to stderr
+    output = run_main(tmp, 'ingest', '--input', timelog, '--db', db).stderr
+
+    with sqlite3.connect(db) as conn:
+        stored = conn.execute("SELECT COUNT(*) FROM time_entries").fetchone()[0]
+    assert f"{len(edited)} new or changed" in output, output
+    assert stored == rows, f"{stored} stored rows for a {rows} row export"
+    assert report(tmp, 'eow', '--db', db) == report(tmp, 'eow', '--input', timelog), "eow --db differs from the export"
+
+
+def eow_counts(text):
+    """Every 'LEVEL: count' of an end of week summary, in report order"""
+    return [int(count) for count in re.findall(r'^(?:EASY|NORMAL|HARD): (\d+)$', text, re.MULTILINE)]
+
+
+def check_range_matches_weeks(tmp, rows):
+    """An end of week summary over two weeks adds up the two single-week ones, for the team and one user
+
+    A range of one week is reported like a single week, so two weeks are
+    needed to go through the rollup table.
+    """
+    timelog = os.path.join(tmp, 'timelog.csv')
+    write_export(timelog, rows, kind='timelog', users=USERS[:2])
+    # Every synthetic entry has its own ticket, so a third of them get a
+    # second entry on the same ticket by the other user
+    df = pd.read_csv(timelog, dtype=str, keep_default_na=False)
+    shared = df.sample(frac=1 / 3, random_state=0)
+    shared['User'] = shared['User'].map({USERS[0]: USERS[1], USERS[1]: USERS[0]})
+    pd.concat([df, shared]).sort_index(kind='stable').to_csv(timelog, index=False)
+
+    weeks = ["{}-W{:02d}".format(*day.isocalendar()[:2]) for day in (date.today() - timedelta(days=7), date.today())]
+    for user in ([], ['--user', USERS[0]]):
+        singles = [eow_counts(report(tmp, 'eow', '--input', timelog, '--week', week, *user)) for week in weeks]
+        text = report(tmp, 'eow', '--input', timelog, '--from', weeks[0], '--to', weeks[1], *user)
+        if user:
+            assert f"{USERS[0]} - " in text, f"--user report is not headed by {USERS[0]}:\n{text}"
+        ranged = eow_counts(text)
+        expected = [first + second for first, second in zip(*singles)]
+        assert ranged == expected, f"eow {weeks[0]}..{weeks[1]} {' '.join(user)}: {ranged} != {expected}"
+
+
+def check_reingest_after_delete(tmp, rows):
+    """Entries deleted from an export are deleted from the store when it is ingested again"""
+    timelog = os.path.join(tmp, 'timelog.csv')
+    db = os.path.join(tmp, 'check.sqlite3')
+    write_export(timelog, rows, kind='timelog')
+    df = pd.read_csv(timelog, dtype=str, keep_default_na=False)
+    # Entries sharing a date, user and issue are keyed by occurrence, so one
+    # such pair is planted and its first entry deleted too
+    df = pd.concat([df, df.iloc[[-1]].assign(Hours='0.5')], ignore_index=True)
+    df.to_csv(timelog, index=False)
+    run_main(tmp, 'ingest', '--input', timelog, '--db', db)
+
+    dates = pd.to_datetime(df['Date']).dt.isocalendar()
+    this_week = (dates['year'] == date.today().isocalendar()[0]) & (dates['week'] == date.today().isocalendar()[1])
+    deleted = list(df.index[this_week][:5]) + [len(df) - 2]
+    df.drop(index=deleted).to_csv(timelog, index=False)
+    output = run_main(tmp, 'ingest', '--input', timelog, '--db', db).stderr
+
+    with sqlite3.connect(db) as conn:
+        stored = conn.execute("SELECT COUNT(*) FROM time_entries").fetchone()[0]
+    assert stored == len(df) - len(deleted), f"{stored} stored rows for a {len(df) - len(deleted)} row export\n{output}"
+    assert report(tmp, 'eow', '--db', db) == report(tmp, 'eow', '--input', timelog), "eow --db differs from the export"
+
+
+CHECKS = [check_reingest_after_edit, check_reingest_after_delete, check_range_matches_weeks]
+
+
+def run(rows):
+    failures = 0
+    for check in CHECKS:
+        with tempfile.TemporaryDirectory() as tmp:
+            try:
+                check(tmp, rows)
+                print(f"ok    {check.__name__}")
+            except AssertionError as e:
+                failures += 1
+                print(f"FAIL  {check.__name__}: {e}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('rows', type=int, nargs='?', default=20_000)
+    args = parser.parse_args()
+    sys.exit(run(args.rows))
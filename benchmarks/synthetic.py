@@ -0,0 +1,87 @@
+"""Synthetic Redmine exports shaped like the ones main.py reads"""
+import os
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+PROJECTS = ['Alpha Portal', 'Billing', 'Mobile App', 'Data Platform', 'Intranet', 'Señor Café']
+TRACKERS = ['Bug', 'Feature', 'Support', 'Task', 'Deployment']
+STATUSES = ['New', 'In Progress', 'Resolved', 'Closed', 'Deploy Request']
+ACTIVITIES = ['Development', 'Testing', 'Review', 'Meeting']
+DIFFICULTIES = ['EASY', 'NORMAL', 'HARD']
+WORK_TYPES = ['Regular Hour', 'Overtime']
+USERS = ['Ubag, Andrew', 'Cruz, Maria', 'Reyes, José', 'Santos, Ana', 'Lim, Kevin', 'Garcia, Liza']
+
+
+def _frame(rng, n, first_id, end_date, days, users):
+    """Build one chunk of random rows shared by both export kinds"""
+    ids = first_id + np.arange(n)
+    offsets = np.sort(rng.integers(0, days, n))
+    dates = pd.to_datetime(end_date) - pd.to_timedelta(days - 1 - offsets, unit='D')
+    tracker = rng.choice(TRACKERS, n, p=[0.3, 0.3, 0.15, 0.2, 0.05])
+    subject = pd.Series(rng.choice(['Fix login', 'Añadir reporte', 'Update API', 'Refactor'], n))
+    return {
+        'ids': ids,
+        'dates': dates,
+        'tracker': tracker,
+        'status': rng.choice(STATUSES, n, p=[0.2, 0.35, 0.2, 0.2, 0.05]),
+        'subject': subject + ' ' + pd.Series(ids).astype(str),
+        'project': rng.choice(PROJECTS, n),
+        'user': rng.choice(users, n),
+        'difficulty': rng.choice(DIFFICULTIES, n, p=[0.4, 0.45, 0.15]),
+        'work_type': rng.choice(WORK_TYPES, n, p=[0.85, 0.15]),
+    }
+
+
+def timelog_frame(rng, n, first_id=1, end_date=None, days=365, users=USERS):
+    """Rows of a Redmine time entry export (``redmine/timelog.csv``)"""
+    c = _frame(rng, n, first_id, end_date or date.today(), days, users)
+    issue = pd.Series(c['tracker']) + ' #' + pd.Series(c['ids'] // 3).astype(str) + ': ' + c['subject']
+    return pd.DataFrame({
+        'Project': c['project'],
+        'Date': c['dates'].strftime('%Y-%m-%d'),
+        'Week': c['dates'].isocalendar().week.to_numpy(),
+        'User': c['user'],
+        'Activity': rng.choice(ACTIVITIES, n),
+        'Issue': issue,
+        'Tracker': c['tracker'],
+        'Status': c['status'],
+        'Comment': rng.choice(['', 'wip', 'done', 'pairing'], n),
+        'Hours': rng.choice([0.5, 1.0, 1.5, 2.0, 4.0, 8.0], n),
+        'Level of Difficulty (Dev)': c['difficulty'],
+        'Work Type': c['work_type'],
+    })
+
+
+def issues_frame(rng, n, first_id=1, end_date=None, days=365, users=USERS):
+    """Rows of a Redmine issue export (``redmine/issues.csv``)"""
+    c = _frame(rng, n, first_id, end_date or date.today(), days, users)
+    return pd.DataFrame({
+        '#': c['ids'],
+        'Project': c['project'],
+        'Tracker': c['tracker'],
+        'Status': c['status'],
+        'Priority': rng.choice(['Low', 'Normal', 'High'], n),
+        'Subject': c['subject'],
+        'Author': c['user'],
+        'Assignee': c['user'],
+        'Start date': c['dates'].strftime('%Y-%m-%d'),
+        'Due date': (c['dates'] + timedelta(days=3)).strftime('%Y-%m-%d'),
+        'Level of Difficulty (Dev)': c['difficulty'],
+        'Work Type': c['work_type'],
+    })
+
+
+def write_export(path, rows, kind='timelog', encoding='utf-8', seed=0, chunk_rows=500_000, **kwargs):
+    """Write ``rows`` synthetic rows to ``path`` in chunks and return its size in bytes"""
+    rng = np.random.default_rng(seed)
+    build = timelog_frame if kind == 'timelog' else issues_frame
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    written = 0
+    with open(path, 'w', encoding=encoding, newline='') as f:
+        while written < rows:
+            n = min(chunk_rows, rows - written)
+            build(rng, n, first_id=written + 1, **kwargs).to_csv(f, index=False, header=written == 0)
+            written += n
+    return os.path.getsize(path)
@@ -1,41 +1,373 @@
+import importlib.util
 import logging
+import re
+import sys
 from enum import Enum
 from typing import Optional, Callable
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
-from rich.prompt import Prompt, IntPrompt
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.align import Align
-from rich import box
-import pandas as pd
 import time
-from datetime import date
-from rich.columns import Columns
-import pyperclip
+import codecs
+import hashlib
+import json
+import ctypes
+import ctypes.util
+import select
+import os
+import contextlib
+import functools
+import atexit
+import queue
+import threading
+import logging.handlers
+import pickle
+import shutil
+from datetime import date, timedelta
+import io
 from io import StringIO
 
-console = Console()
-output = StringIO()
 
-# Configure logging
+def _lazy_import(name):
+    """Module that is only executed on first attribute access"""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+# pandas and numpy dominate import time, so they load when a report first needs them
+np = _lazy_import('numpy')
+pd = _lazy_import('pandas')
+
+
+def _ensure_loaded():
+    """Finish the lazy numpy and pandas imports; call before starting threads or pools
+
+    A lazy module runs on its first attribute access, and that is not safe to
+    race: a second thread can see the module half executed.
+    """
+    for name in ('numpy', 'pandas'):
+        importlib.import_module(name)
+
+
+class _LazyConsole:
+    """Stands in for the Rich console and only imports Rich on first use"""
+
+    def __init__(self):
+        object.__setattr__(self, '_console', None)
+
+    def get(self):
+        if self._console is None:
+            from rich.console import Console
+            object.__setattr__(self, '_console', Console())
+        return self._console
+
+    def __getattr__(self, name):
+        return getattr(self.get(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self.get(), name, value)
+
+
+console = _LazyConsole()
+
+# Configure logging: records are formatted by the caller and put on a queue,
+# and a background listener does the file and terminal writes
+_log_queue = queue.SimpleQueue()
+# Terminal half of the log; --quiet raises it to warnings and errors
+_log_stream = logging.StreamHandler()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    # delay: the log file is opened on the first record, not at import
+    logging.FileHandler('menu_app.log', delay=True),
+    _log_stream,
+    respect_handler_level=True,
+)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('menu_app.log'),
-        logging.StreamHandler()
-    ]
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
+# Opt-in stage instrumentation, enabled with --trace/--profile or WGG_TRACE=1 (or =profile)
+TRACE_PATH = 'menu_app.trace.jsonl'
+_tracer = None
+
+
+def _resident_bytes():
+    """Resident set size of this process, or 0 where /proc is not available"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return 0
+
+
+def _row_count(value):
+    """Rows held by a stage argument or result: frames, tuples and dicts of them, else None"""
+    if hasattr(value, 'columns'):
+        return len(value)
+    if isinstance(value, dict):
+        value = list(value.values())
+    if isinstance(value, (tuple, list)):
+        counts = [count for count in map(_row_count, value) if count is not None]
+        return sum(counts) if counts else None
+    return None
+
+
+class StageTracer:
+    """Appends one JSON line per traced stage call next to menu_app.log
+
+    Each record carries the stage, its parent stage, the run it belongs to,
+    wall time, rows in and out and the change in resident memory. With
+    profile on, every run also dumps cProfile stats and the top tracemalloc
+    allocation sites.
+    """
+
+    def __init__(self, path=TRACE_PATH, profile=False):
+        self.path = path
+        self.profile = profile
+        self.run_id = None
+        # Stages nest per thread, so parallel loads keep their own parents
+        self._local = threading.local()
+
+    def emit(self, record):
+        record.update(run=self.run_id, pid=os.getpid(), time=time.time())
+        # One short append per record, so forked workers can share the file
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, default=str) + '\n')
+
+    @property
+    def stack(self):
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = []
+        return self._local.stack
+
+    def call(self, stage, func, args, kwargs):
+        stack = self.stack
+        parent = stack[-1] if stack else None
+        stack.append(stage)
+        memory = _resident_bytes()
+        start = time.perf_counter()
+        error = None
+        result = None
+        try:
+            result = func(*args, **kwargs)
+            return result
+        except BaseException as e:
+            error = type(e).__name__
+            raise
+        finally:
+            stack.pop()
+            self.emit({
+                'stage': stage, 'parent': parent,
+                'seconds': round(time.perf_counter() - start, 6),
+                'rows_in': _row_count(args), 'rows_out': _row_count(result),
+                'memory_delta': _resident_bytes() - memory, 'error': error,
+            })
+
+    @contextlib.contextmanager
+    def run(self, name):
+        """Group the stages of one report run and profile it when asked to"""
+        self.run_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{name}"
+        profiler = None
+        if self.profile:
+            import cProfile
+            import tracemalloc
+            profiler = cProfile.Profile()
+            tracemalloc.start()
+            profiler.enable()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            record = {'stage': 'run', 'name': name, 'seconds': round(time.perf_counter() - start, 6)}
+            if profiler is not None:
+                profiler.disable()
+                record['profile'] = self._dump_profile(profiler)
+            self.emit(record)
+            self.run_id = None
+
+    def _dump_profile(self, profiler):
+        import tracemalloc
+        stem = os.path.join(os.path.dirname(self.path), f"menu_app.{self.run_id}")
+        profiler.dump_stats(stem + '.prof')
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        with open(stem + '.memory.txt', 'w', encoding='utf-8') as f:
+            f.write(f"Peak traced memory: {peak} bytes\n")
+            for stat in snapshot.statistics('lineno')[:30]:
+                f.write(f"{stat}\n")
+        return stem + '.prof'
+
+
+def enable_tracing(profile=False, path=TRACE_PATH):
+    global _tracer
+    _tracer = StageTracer(path, profile)
+
+
+def trace_run(name):
+    """Context for one report run; does nothing while instrumentation is off"""
+    return _tracer.run(name) if _tracer is not None else contextlib.nullcontext()
+
+
+def traced(func):
+    """Record calls of func as a pipeline stage while instrumentation is on"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        # Disabled cost: one global lookup per stage call
+        if _tracer is None:
+            return func(*args, **kwargs)
+        return _tracer.call(func.__name__, func, args, kwargs)
+    return wrapper
+
+
+if os.environ.get('WGG_TRACE'):
+    enable_tracing(profile=os.environ['WGG_TRACE'] == 'profile')
+
+# Progress bars are redrawn at most this often, however fast work is reported
+PROGRESS_INTERVAL = 0.1
+# Read size of exports parsed under a progress bar
+PROGRESS_READ_BYTES = 1024 * 1024
+# The progress meter of each thread, so parallel loads advance their own rows
+_progress = threading.local()
+
+
+class ProgressMeter:
+    """Moves one task of a Rich progress display by units of real work
+
+    Each stage sets its own total and unit (bytes, rows, days); advancing
+    only adds to a counter until PROGRESS_INTERVAL has passed or the stage
+    is complete, so hot loops do not pay for redraws.
+    """
+
+    def __init__(self, progress, task):
+        self.progress = progress
+        self.task = task
+        self.completed = 0
+        self.total = None
+        self.unit = ''
+        self._shown = 0.0
+
+    def stage(self, description, total=None, unit=''):
+        self.completed, self.total, self.unit = 0, total, unit
+        self._shown = time.monotonic()
+        self.progress.update(self.task, description=description, total=total, completed=0, done=self._done())
+
+    def advance(self, units):
+        self.completed += units
+        now = time.monotonic()
+        if now - self._shown >= PROGRESS_INTERVAL or (self.total is not None and self.completed >= self.total):
+            self._shown = now
+            self.progress.update(self.task, completed=self.completed, done=self._done())
+
+    def _done(self):
+        if self.total is None:
+            return ''
+        if self.unit == 'bytes':
+            return f"{self.completed / 1e6:.1f}/{self.total / 1e6:.1f} MB"
+        return f"{self.completed:,}/{self.total:,} {self.unit}"
+
+
+def progress_stage(description, total=None, unit=''):
+    """Start a stage on this thread's progress bar; does nothing without one"""
+    meter = getattr(_progress, 'meter', None)
+    if meter is not None:
+        meter.stage(description, total, unit)
+
+
+def progress_advance(units=1):
+    """Count units of work done on this thread's progress bar, if it has one"""
+    meter = getattr(_progress, 'meter', None)
+    if meter is not None:
+        meter.advance(units)
+
+
+@contextlib.contextmanager
+def progress_display():
+    """A transient Rich progress display, or None when the console is not a terminal"""
+    if not console.is_terminal:
+        yield None
+        return
+    from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
+
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TextColumn("{task.fields[done]}"),
+        console=console.get(),
+        transient=True
+    ) as progress:
+        yield progress
+
+
+@contextlib.contextmanager
+def track_progress(progress, description):
+    """Report this thread's work to a new task of progress, unless progress is None"""
+    if progress is None:
+        yield
+        return
+    _progress.meter = ProgressMeter(progress, progress.add_task(description, total=None, done=''))
+    try:
+        yield
+    finally:
+        del _progress.meter
+
+
+class _ProgressFile(io.RawIOBase):
+    """Unbuffered binary file that counts every byte read on this thread's progress bar"""
+
+    def __init__(self, file_path):
+        self._file = open(file_path, 'rb', buffering=0)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        count = self._file.readinto(buffer)
+        if count:
+            progress_advance(count)
+        return count
+
+    def close(self):
+        self._file.close()
+        super().close()
+
+
+@contextlib.contextmanager
+def open_export(file_path):
+    """Yield what pd.read_csv should read: file_path itself, or a byte-counting file under a progress bar"""
+    if getattr(_progress, 'meter', None) is None:
+        yield file_path
+        return
+    progress_stage(f"Reading {file_path}...", os.path.getsize(file_path), 'bytes')
+    with io.BufferedReader(_ProgressFile(file_path), PROGRESS_READ_BYTES) as f:
+        yield f
+
+# Name and team shown in report headers; team runs use "<user> - <team>"
+REPORT_TEAM = 'JWD'
+REPORT_AUTHOR = f'Ubag, Andrew - {REPORT_TEAM}'
+
+
+def user_author(user, team=REPORT_TEAM):
+    """Header author of a report narrowed to one user, or None for REPORT_AUTHOR"""
+    return f"{user} - {team}" if user is not None else None
+
 class MenuChoice(Enum):
     """Enum for menu choices to ensure type safety"""
     GENERATE_WEEKLY_GOALS = 1
     COMPARE = 2
     END_OF_WEEK_SUMMARY = 3
     QUIT = 4
+    CLEAR_CACHE = 5
     
 class Workweek(Enum):
     SUNDAY = 0
@@ -46,246 +378,1497 @@ class Workweek(Enum):
     FRIDAY = 5
     SATURDAY = 6
 
-class Difficulty(Enum):
-    EASY = 2
-    NORMAL = 3
-    HARD = 8
+class Difficulty(Enum):
+    EASY = 2
+    NORMAL = 3
+    HARD = 8
+
+
+class WorkType(Enum):
+    OVERTIME = "Overtime"
+    REGULAR_HOUR = "Regular Hour"
+
+
+
+class ReportingClock(tuple):
+    """An ISO (year, week) with the dates its reports print, worked out once
+
+    It is the plain (year, week) tuple everywhere a week is passed, and also
+    carries the week's Monday, Friday and month name.
+    """
+
+    def __new__(cls, year, week):
+        clock = super().__new__(cls, (year, week))
+        clock.year, clock.week = year, week
+        clock.monday = date.fromisocalendar(year, week, 1)
+        clock.friday = date.fromisocalendar(year, week, 5)
+        clock.month_name = clock.monday.strftime("%B")
+        return clock
+
+    def __getnewargs__(self):
+        return tuple(self)
+
+    @classmethod
+    def today(cls):
+        """Clock of today's week, read from the system clock now"""
+        return reporting_clock(tuple(date.today().isocalendar())[:2])
+
+    def label(self):
+        """'<month> <monday>-<friday>, <year>' as report headers print it"""
+        return f"{self.month_name} {self.monday.day}-{self.friday.day}, {self.year}"
+
+
+# The current week of this run, fixed the first time it is needed, and the
+# week it is pinned to, if any
+_run_clock = None
+_pinned_clock = None
+
+
+@functools.lru_cache(maxsize=None)
+def _clock(year, week):
+    return ReportingClock(year, week)
+
+
+def reporting_clock(week=None, live=False):
+    """Clock of an ISO (year, week), or of this run's current week
+
+    The current week is read once per run, so a run that crosses midnight
+    still reports one week; live re-reads it for long-running servers.
+    WGG_REPORT_WEEK (e.g. 2025-W32) or set_reporting_clock() pins it to any week.
+    """
+    global _run_clock, _pinned_clock
+    if week is not None:
+        return _clock(*week)
+    if _run_clock is None or live:
+        _run_clock = ReportingClock.today()
+        if _pinned_clock is None and os.environ.get('WGG_REPORT_WEEK'):
+            _pinned_clock = _clock(*parse_week(os.environ['WGG_REPORT_WEEK']))
+    return _pinned_clock or _run_clock
+
+
+def set_reporting_clock(week):
+    """Pin the current week of this run to week, or unpin it with None"""
+    global _pinned_clock
+    _pinned_clock = week and _clock(*week)
+    return reporting_clock()
+
+
+def current_iso_week():
+    """(ISO year, ISO week) this run reports on, today's unless pinned"""
+    return reporting_clock()
+
+
+def parse_week(text):
+    """Parse '2025-W32', '2025-32' or '32' (this ISO year) into (year, week)"""
+    match = re.fullmatch(r'(?:(\d{4})-?W?)?(\d{1,2})', text.strip(), re.IGNORECASE)
+    if not match:
+        raise ValueError(f"Not an ISO week: {text!r} (expected e.g. 2025-W32)")
+    year = int(match[1]) if match[1] else current_iso_week()[0]
+    # Round-trip through a date to reject week 53 in 52-week years
+    date.fromisocalendar(year, int(match[2]), 1)
+    return year, int(match[2])
+
+
+def weeks_between(first, last):
+    """Every ISO week from first to last inclusive"""
+    monday = date.fromisocalendar(*first, 1)
+    end = date.fromisocalendar(*last, 1)
+    weeks = []
+    while monday <= end:
+        weeks.append(tuple(monday.isocalendar())[:2])
+        monday += timedelta(days=7)
+    return weeks
+
+
+def month_weeks(year, month):
+    """ISO weeks belonging to a month, i.e. whose Thursday falls in it"""
+    first = date(year, month, 1)
+    thursday = first + timedelta(days=(3 - first.weekday()) % 7)
+    weeks = []
+    while thursday.month == month:
+        weeks.append(tuple(thursday.isocalendar())[:2])
+        thursday += timedelta(days=7)
+    return weeks
+
+
+def quarter_weeks(year, quarter):
+    """ISO weeks of the three months of a quarter (1-4)"""
+    return [week for month in range(3 * quarter - 2, 3 * quarter + 1) for week in month_weeks(year, month)]
+
+
+def _range_label(first, last):
+    """Header dates from the Monday of first to the Friday of last"""
+    monday = reporting_clock(first).monday
+    friday = reporting_clock(last).friday
+    return f"{monday.strftime('%B')} {monday.day}, {monday.year} - {friday.strftime('%B')} {friday.day}, {friday.year}"
+
+
+DIFFICULTY_COLUMN = 'Level of Difficulty (Dev)'
+DIFFICULTY_LEVELS = [level.name for level in Difficulty]
+
+
+def aggregate_difficulty(df, by=None):
+    """Count rows per (by value, difficulty) from a single groupby
+
+    Returns a frame of counts with one row per value of the ``by`` column
+    (a single 'ALL' row when ``by`` is None) and one column per difficulty
+    level, plus a frame of the same shape with summed 'Hours', or None when
+    the frame has no 'Hours' column.
+    """
+    keys = df[by] if by else pd.Series('ALL', index=df.index, name='All')
+    grouped = df.groupby([keys, df[DIFFICULTY_COLUMN]], observed=True)
+
+    counts = _difficulty_matrix(grouped.size(), 0).astype(int)
+    hours = _difficulty_matrix(grouped['Hours'].sum(), 0.0) if 'Hours' in df.columns else None
+    return counts, hours
+
+
+def _difficulty_matrix(cells, fill):
+    """Pivot (key, difficulty) cells into one column per difficulty level"""
+    return cells.unstack(DIFFICULTY_COLUMN).reindex(columns=DIFFICULTY_LEVELS).fillna(fill)
+
+
+def _counts_for(counts, key):
+    """Difficulty counts of one row of an aggregate_difficulty matrix, zero if absent"""
+    if key in counts.index:
+        return counts.loc[key].to_dict()
+    return dict.fromkeys(DIFFICULTY_LEVELS, 0)
+
+
+# Seconds pending clipboard copies and saves may delay exit
+OUTPUT_DRAIN_SECONDS = 5.0
+# Seconds a report waits for its clipboard copy, so the confirmation prints with it
+CLIPBOARD_WAIT_SECONDS = 1.0
+
+
+def clipboard_available():
+    """False where a copy could only fail or hang: headless or SSH sessions without a display
+
+    WGG_CLIPBOARD=0 turns copying off everywhere.
+    """
+    if os.environ.get('WGG_CLIPBOARD') == '0':
+        return False
+    if not sys.platform.startswith('linux'):
+        return True
+    if os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'):
+        return True
+    # WSL copies through clip.exe and needs no display
+    try:
+        with open('/proc/version') as f:
+            return 'microsoft' in f.read().lower()
+    except OSError:
+        return False
+
+
+class OutputWorker:
+    """Background thread running clipboard copies and file saves in submission order
+
+    The thread starts with the first job. Jobs still pending at exit get up
+    to OUTPUT_DRAIN_SECONDS; a copy stuck on an unresponsive clipboard tool
+    cannot keep the process alive.
+    """
+
+    def __init__(self):
+        self.jobs = queue.SimpleQueue()
+        self.thread = None
+
+    def submit(self, func, *args):
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, name='output-worker', daemon=True)
+            self.thread.start()
+            atexit.register(self.drain)
+        self.jobs.put((func, args))
+
+    def drain(self, timeout=OUTPUT_DRAIN_SECONDS):
+        """Wait until every job submitted so far has run, at most timeout seconds"""
+        if self.thread is None:
+            return True
+        done = threading.Event()
+        self.jobs.put((done.set, ()))
+        return done.wait(timeout)
+
+    def _run(self):
+        while True:
+            func, args = self.jobs.get()
+            try:
+                func(*args)
+            except Exception as e:
+                logger.error(f"Background output failed: {str(e)}")
+
+
+output_worker = OutputWorker()
+
+
+class ClipboardCopy:
+    """Copy of a finished report, run on the output worker
+
+    Nothing is printed from the worker; whoever submitted the copy reports
+    its outcome once done is set, so messages stay next to the report.
+    """
+
+    def __init__(self, text):
+        self.text = text
+        self.error = None
+        self.done = threading.Event()
+
+    def __call__(self):
+        try:
+            import pyperclip
+            pyperclip.copy(self.text)
+        except Exception as e:
+            self.error = e
+        finally:
+            self.done.set()
+
+
+def copy_to_clipboard(text, wait=CLIPBOARD_WAIT_SECONDS):
+    """Copy text on the output worker and print the outcome if it comes within wait seconds"""
+    copy = ClipboardCopy(text)
+    output_worker.submit(copy)
+    if not copy.done.wait(wait):
+        console.print("[yellow]Still copying the report to the clipboard in the background[/yellow]")
+    elif copy.error is not None:
+        console.print(f"[yellow]Clipboard unavailable, report not copied: {copy.error}[/yellow]")
+        logger.warning(f"Clipboard copy failed: {str(copy.error)}")
+    else:
+        console.print("[green]Output successfully copied to clipboard 📋📋📋[/green]")
+
+
+def save_report(path, text):
+    """Write a finished report to path; runs on the output worker"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    logger.info(f"Report saved to {path}")
+
+
+class ReportWriter:
+    """File-like sink for a single report
+
+    Text is streamed to the console as it is written. Only the clipboard and
+    the optional save_path need the whole report, so only this run's text is
+    buffered, and only when one of them is enabled. On close() both are handed
+    to the output worker, so the report is on screen before any of that I/O;
+    close() then waits briefly for the copy to print its confirmation.
+    Without a usable clipboard the copy is skipped with a notice.
+    """
+
+    def __init__(self, to_console=True, to_clipboard=True, save_path=None):
+        self.to_console = to_console
+        self.to_clipboard = to_clipboard and clipboard_available()
+        self.save_path = save_path
+        self.buffer = StringIO() if self.to_clipboard or save_path else None
+        self.skipped_clipboard = to_clipboard and not self.to_clipboard
+
+    def write(self, text):
+        if self.to_console:
+            console.print(text, end='')
+        if self.buffer is not None:
+            self.buffer.write(text)
+        return len(text)
+
+    def close(self):
+        if self.to_console:
+            console.print()
+        if self.buffer is not None:
+            text = self.buffer.getvalue()
+            self.buffer = None
+            if self.save_path:
+                output_worker.submit(save_report, self.save_path, text)
+            if self.to_clipboard:
+                copy_to_clipboard(text)
+        if self.skipped_clipboard:
+            console.print("[yellow]No clipboard in this session; the report was not copied[/yellow]")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def print_summary(df):
+    counts = _counts_for(aggregate_difficulty(df)[0], 'ALL')
+    print()
+    print(f"SUMMARY:")
+    print(f"EASY: {counts['EASY']}")
+    print(f"NORMAL: {counts['NORMAL']}")
+    print(f"HARD: {counts['HARD']}")
+    print(f"Grand Total: {sum(counts.values())}")
+
+
+def report_header(author=None, week=None, last_week=None):
+    """'<author> - <month> <monday>-<friday>, <year>', or the whole range when last_week differs"""
+    clock = reporting_clock(week)
+    if last_week and last_week != clock:
+        return f"{author or REPORT_AUTHOR} - {_range_label(clock, last_week)}"
+    return f"{author or REPORT_AUTHOR} - {clock.label()}"
+
+
+@traced
+def render_eow_summary(tasks_for_this_week, out, author=None, week=None):
+    """Write the end of week summary for tasks_for_this_week to out"""
+    write_text(build_eow_summary(tasks_for_this_week, author, week), out)
+
+
+def write_eow_summary(counts, out, author=None, week=None, last_week=None):
+    """Write an end of week summary from a work type x difficulty count matrix
+
+    week defaults to the current ISO week; with last_week the header spans
+    the whole range of weeks instead.
+    """
+    out.write("\n")
+    out.write("END OF WEEK SUMMARY:\n")
+
+
+    out.write(f"{report_header(author, week, last_week)}\n")
+    out.write("\n")
+
+    for work_type_enum in (WorkType.REGULAR_HOUR, WorkType.OVERTIME):
+        level_counts = _counts_for(counts, work_type_enum.value)
+
+        # Print results for this work
+        out.write("\n")
+        out.write(f"{work_type_enum.value}:\n")
+        out.write(f"EASY: {level_counts['EASY']}\n")
+        out.write(f"NORMAL: {level_counts['NORMAL']}\n")
+        out.write(f"HARD: {level_counts['HARD']}\n")
+
+
+def print_eow_summary(tasks_for_this_week):
+    with ReportWriter() as writer:
+        render_eow_summary(tasks_for_this_week, writer)
+
+
+ENCODINGS = ['utf-8', 'latin-1', 'windows-1252', 'iso-8859-1', 'cp1252']
+# Only this many leading bytes are decoded when guessing the encoding
+ENCODING_SAMPLE_BYTES = 1024 * 1024
+
+
+def detect_encoding(file_path, encodings=ENCODINGS, sample_size=ENCODING_SAMPLE_BYTES):
+    """Return the first encoding that decodes a bounded sample of the file"""
+    with open(file_path, 'rb') as f:
+        sample = f.read(sample_size)
+    # A truncated sample may end mid-character, so only a short file is decoded as final
+    final = len(sample) < sample_size
+
+    for encoding in encodings:
+        try:
+            codecs.getincrementaldecoder(encoding)().decode(sample, final=final)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+    return None
+
+
+# Parsed exports are cached here, keyed by file fingerprint. Cache entries are
+# pickles, so the cache lives in a private per-user directory rather than
+# next to the exports, where anyone sharing the folder could plant one
+CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'), 'wgg')
+CACHE_MAX_BYTES = 512 * 1024 * 1024
+# Bump when the shape of cached frames changes so old entries are never reused
+CACHE_VERSION = 4
+# Bytes hashed from each end of an export for the content part of its fingerprint
+FINGERPRINT_SAMPLE_BYTES = 64 * 1024
+
+
+def file_fingerprint(file_path):
+    """Fingerprint an export by path, size, mtime and a hash of its head and tail"""
+    stat = os.stat(file_path)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{os.path.abspath(file_path)}|{stat.st_size}|{stat.st_mtime_ns}|{CACHE_VERSION}".encode())
+    with open(file_path, 'rb') as f:
+        digest.update(f.read(FINGERPRINT_SAMPLE_BYTES))
+        if stat.st_size > FINGERPRINT_SAMPLE_BYTES:
+            f.seek(max(FINGERPRINT_SAMPLE_BYTES, stat.st_size - FINGERPRINT_SAMPLE_BYTES))
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def make_cache_dir():
+    """Create CACHE_DIR readable by its owner alone"""
+    os.makedirs(CACHE_DIR, mode=0o700, exist_ok=True)
+    os.chmod(CACHE_DIR, 0o700)
+
+
+def cache_dir_trusted():
+    """Whether CACHE_DIR belongs to this user and nobody else can write to it
+
+    Unpickling runs code, so nothing is loaded from a cache someone else
+    could have filled.
+    """
+    try:
+        stat = os.stat(CACHE_DIR)
+    except FileNotFoundError:
+        return False
+    if not hasattr(os, 'getuid'):
+        return True
+    if stat.st_uid != os.getuid() or stat.st_mode & 0o022:
+        logger.warning(f"Ignoring cache {CACHE_DIR}: not private to this user")
+        return False
+    return True
+
+
+def _cache_entry(file_path, fingerprint, kind='frame'):
+    path_key = hashlib.blake2b(f"{os.path.abspath(file_path)}|{kind}".encode(), digest_size=8).hexdigest()
+    return os.path.join(CACHE_DIR, f"{path_key}-{fingerprint}.pkl")
+
+
+def load_cached_frame(file_path, kind='frame'):
+    """Return the cached frame of this kind for this exact export, or None on a miss"""
+    if not cache_dir_trusted():
+        return None
+    entry = _cache_entry(file_path, file_fingerprint(file_path), kind)
+    try:
+        with open(entry, 'rb') as f:
+            df = pickle.load(f)
+        # Touch the entry so eviction drops the least recently used ones first
+        os.utime(entry)
+        return df
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable cache entry {entry}: {e}")
+        return None
+
+
+def store_cached_frame(file_path, df, kind='frame'):
+    """Cache a frame derived from an export, replacing older entries of that kind for the same path"""
+    entry = _cache_entry(file_path, file_fingerprint(file_path), kind)
+    try:
+        make_cache_dir()
+        prefix = os.path.basename(entry).split('-')[0] + '-'
+        for name in os.listdir(CACHE_DIR):
+            if name.startswith(prefix):
+                os.remove(os.path.join(CACHE_DIR, name))
+        tmp = entry + '.tmp'
+        with open(tmp, 'wb') as f:
+            pickle.dump(df, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, entry)
+        evict_cache(keep=entry)
+    except OSError as e:
+        logger.warning(f"Could not cache {file_path}: {e}")
+
+
+def _index_entries():
+    """(last use, bytes, directory) of every week index; last use is the mtime of its index.json"""
+    if not os.path.isdir(INDEX_DIR):
+        return []
+    entries = []
+    for name in os.listdir(INDEX_DIR):
+        directory = os.path.join(INDEX_DIR, name)
+        try:
+            used = os.stat(os.path.join(directory, 'index.json')).st_mtime
+        except FileNotFoundError:
+            # Still being built, or abandoned half way: fall back to the directory
+            try:
+                used = os.stat(directory).st_mtime
+            except FileNotFoundError:
+                continue
+        size = 0
+        for part in os.scandir(directory):
+            with contextlib.suppress(FileNotFoundError):
+                size += part.stat().st_size
+        entries.append((used, size, directory))
+    return entries
+
+
+def evict_cache(max_bytes=CACHE_MAX_BYTES, keep=None):
+    """Delete least recently used entries until the cache fits in max_bytes
+
+    Cached frames and whole week indexes are entries alike; keep, the entry
+    just written, is never deleted.
+    """
+    entries = _index_entries()
+    if os.path.isdir(CACHE_DIR):
+        for name in os.listdir(CACHE_DIR):
+            path = os.path.join(CACHE_DIR, name)
+            # Skip entries another load is still writing or has just replaced
+            if name.endswith('.tmp') or not os.path.isfile(path):
+                continue
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        if path == keep:
+            continue
+        if os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+        total -= size
+
+
+def clear_cache():
+    """Remove every cached export and week index; returns how many of each were deleted"""
+    indexes = len(_index_entries())
+    shutil.rmtree(INDEX_DIR, ignore_errors=True)
+    exports = 0
+    if os.path.isdir(CACHE_DIR):
+        for name in os.listdir(CACHE_DIR):
+            path = os.path.join(CACHE_DIR, name)
+            if os.path.isdir(path):
+                shutil.rmtree(path)
+            else:
+                os.remove(path)
+                exports += 1
+    return exports, indexes
+
+
+def _encoding_candidates(file_path):
+    """Detected encoding first, then the remaining fallbacks after it"""
+    encoding = detect_encoding(file_path)
+    return ENCODINGS[ENCODINGS.index(encoding):] if encoding else ['utf-8']
+
+
+def _read_attempts(file_path):
+    """read_csv encoding options to try in turn: every candidate, then UTF-8 ignoring errors"""
+    attempts = [{'encoding': encoding} for encoding in _encoding_candidates(file_path)]
+    attempts.append({'encoding': 'utf-8', 'encoding_errors': 'ignore'})
+    return attempts
+
+
+# Declared schema of the Redmine exports. Only these columns are parsed,
+# low-cardinality text is held as categoricals and dates are parsed once
+CATEGORY_COLUMNS = ['Project', 'Tracker', 'Status', 'Work Type', DIFFICULTY_COLUMN, 'User', 'Assignee']
+DATE_COLUMNS = ['Start date', 'Date']
+DATE_FORMATS = ['%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y', '%Y/%m/%d', '%d.%m.%Y']
+EXPORT_COLUMNS = {*CATEGORY_COLUMNS, *DATE_COLUMNS, 'Week', 'Issue', '#', 'Subject', 'Hours'}
+# read_csv options applying the schema at parse time
+EXPORT_READ_OPTIONS = {
+    'usecols': lambda column: column in EXPORT_COLUMNS,
+    'dtype': dict.fromkeys(CATEGORY_COLUMNS, 'category'),
+}
+
+
+def _parse_dates(values):
+    """Parse a date column with the first of DATE_FORMATS that fits a sample of it"""
+    sample = values.dropna().iloc[:100]
+    for date_format in DATE_FORMATS:
+        try:
+            pd.to_datetime(sample, format=date_format)
+        except (ValueError, TypeError):
+            continue
+        return pd.to_datetime(values, format=date_format, errors='coerce')
+    return pd.to_datetime(values, errors='coerce')
+
+
+def apply_schema(df):
+    """Give a frame's export columns their declared dtypes; already typed columns are left alone
+
+    Concatenating chunks with different categories falls back to plain
+    objects, so assembled frames go through here once more.
+    """
+    for column in CATEGORY_COLUMNS:
+        if column in df.columns and not isinstance(df[column].dtype, pd.CategoricalDtype):
+            df[column] = df[column].astype('category')
+    for column in DATE_COLUMNS:
+        if column in df.columns and not pd.api.types.is_datetime64_any_dtype(df[column]):
+            df[column] = _parse_dates(df[column])
+    return df
+
+
+@traced
+def parse_csv(file_path):
+    """Parse an export in one pass and return the frame with the encoding used"""
+    # Parse once with the detected encoding; only fall through to the next
+    # candidate when bytes past the sample turn out to be undecodable
+    for encoding in _encoding_candidates(file_path):
+        try:
+            with open_export(file_path) as source:
+                return apply_schema(pd.read_csv(source, encoding=encoding, **EXPORT_READ_OPTIONS)), encoding
+        except UnicodeDecodeError:
+            continue
+
+    console.print(f"[green]Read with UTF-8 and ignored errors[/green]")
+    with open_export(file_path) as source:
+        df = pd.read_csv(source, encoding='utf-8', encoding_errors='ignore', **EXPORT_READ_OPTIONS)
+    return apply_schema(df), 'utf-8'
+
+
+@traced
+def read_csv_file(file_path):
+
+    try:
+        df = load_cached_frame(file_path)
+        if df is not None:
+            console.print(f"[green]Loaded from cache: {file_path}[/green]")
+        else:
+            df, encoding = parse_csv(file_path)
+            console.print(f"[green]Successfully read with encoding: {encoding}[/green]")
+            store_cached_frame(file_path, df)
+
+        # Display basic information about the dataset
+        console.print(f"[green]Successfully loaded CSV file: {file_path}[/green]")
+        console.print(f"[white on magenta]Shape: {df.shape} (rows, columns)[/white on magenta]")
+        columns = list(df.columns)
+        colors = ["red", "green", "yellow", "blue", "magenta", "cyan", "white"]
+        styled_columns = [
+            f"[{colors[i % len(colors)]}]{col}[/]" for i, col in enumerate(columns)
+        ]
+        from rich.columns import Columns
+        console.print(Columns(styled_columns))
+        console.print()
+        # print("\nFirst 5 rows:")
+        # print(df.head())
+        
+        return df
+        
+    except FileNotFoundError:
+        console.print(f"[red]Error: File '{file_path}' not found.[/red]")
+        return None
+    except pd.errors.EmptyDataError:
+        console.print(f"[red]Error: The file '{file_path}' is empty.[/red]")
+        return None
+    except Exception as e:
+        console.print(f"[red]Error reading file: {e}[/red]")
+        return None
+    
+    
+def _as_text(series):
+    """Format every value the way an f-string would, as one object column"""
+    return pd.Series(series.to_numpy().astype(str), index=series.index, dtype=object)
+
+
+@traced
+def render_day_blocks(raw_data):
+    """Render the text block of every day in raw_data in one vectorized pass
+
+    Returns the blocks keyed like raw_data together with the difficulty
+    counts of all rendered rows.
+    """
+    rows, counts = goal_rows(raw_data)
+    blocks = day_blocks([name for name, _ in raw_data.values()], rows)
+    return dict(zip(raw_data, blocks)), counts
+
+
+def goal_rows(raw_data):
+    """Rows listed by weekly goals for raw_data in report order, plus their difficulty counts
+
+    The rows carry 'Project', 'Issue', the difficulty and '_day', the
+    position of their day in raw_data.
+    """
+    keys = list(raw_data)
+    frames = []
+    for position, key in enumerate(keys):
+        day_df = raw_data[key][1]
+        if {'Project', 'Issue'}.issubset(day_df.columns):
+            rows = day_df.reindex(columns=['Project', 'Issue', DIFFICULTY_COLUMN])
+            # Drop rows with missing 'Project' or 'Issue' (optional, for cleaner output)
+            frames.append(rows.dropna(subset=['Project', 'Issue']).assign(_day=position))
+
+    rows = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(
+        {'Project': [], 'Issue': [], DIFFICULTY_COLUMN: [], '_day': []})
+    # Days in raw_data order, projects sorted within a day, tickets in export order
+    rows = rows.sort_values(['_day', 'Project'], kind='stable')
+
+    difficulty = rows[DIFFICULTY_COLUMN]
+    counts = difficulty.value_counts()
+    counts = {level: int(counts.get(level, 0)) for level in DIFFICULTY_LEVELS}
+    counts['TOTAL'] = len(rows)
+    return rows, counts
+
+
+def day_blocks(days, rows):
+    """Slack-style text block of every day from goal_rows output, built in one vectorized pass"""
+    difficulty = rows[DIFFICULTY_COLUMN]
+    day = rows['_day'].to_numpy()
+    project = rows['Project']
+    starts = (rows['_day'] != rows['_day'].shift()) | (project != project.shift())
+    ends = starts.shift(-1, fill_value=True)
+    lines = '• ' + _as_text(rows['Issue']) + ' - ' + _as_text(difficulty) + '\n'
+    lines = lines.where(~starts, '_*' + _as_text(project) + '*_\n' + lines)
+    lines = lines.where(~ends, lines + '\n')
+
+    bounds = day.searchsorted(range(len(days) + 1))
+    blocks = []
+    for position, name in enumerate(days):
+        body = ''.join(lines.iloc[bounds[position]:bounds[position + 1]].tolist())
+        blocks.append(f"*{name}*\n" + (body or "_N/A_\n\n"))
+    return blocks
+
+
+@traced
+def render_weekly_goals(raw_data, out, author=None, week=None):
+    """Write the weekly goals report for raw_data to out"""
+    write_text(build_weekly_goals(raw_data, author, week), out)
+
+
+def write_weekly_goals(blocks, counts, out, author=None, week=None):
+    """Write already rendered day blocks and their difficulty counts as a report
+
+    counts is only read once every block is written, so a generator of
+    blocks may fill it in as it goes.
+    """
+    out.write("*WEEKLY GOALS*\n")
+    out.write(f"{report_header(author, week)}\n")
+    out.write("\n")
+    progress_stage("Rendering weekly goals...", len(WORKDAYS), 'days')
+    for block in blocks:
+        out.write(block)
+        progress_advance()
+
+    out.write(f"SUMMARY:\n")   
+    out.write(f"EASY: {counts['EASY']}\n")
+    out.write(f"NORMAL: {counts['NORMAL']}\n")
+    out.write(f"HARD: {counts['HARD']}\n")
+    out.write(f"Grand Total: {counts['TOTAL']}\n")
+
+
+def print_output(raw_data):
+    with ReportWriter() as writer:
+        render_weekly_goals(raw_data, writer)
+
+
+def stream_weekly_goals(raws, out, author=None, week=None):
+    """Write the merged weekly goals of several exports to out one day at a time
+
+    Each day is merged, rendered and written before the next one is built,
+    so memory is bounded by the largest day rather than the whole report.
+    Returns the difficulty counts of every day, keyed by day name.
+    """
+    day_counts = {}
+    counts = dict.fromkeys(DIFFICULTY_LEVELS + ['TOTAL'], 0)
+
+    def blocks():
+        for key, (name, day) in iter_merged_days(*raws):
+            rows, day_counts[name] = goal_rows({key: (name, day)})
+            for level, count in day_counts[name].items():
+                counts[level] += count
+            yield day_blocks([name], rows)[0]
+
+    write_weekly_goals(blocks(), counts, out, author, week)
+    return day_counts
+
+
+def print_goals_summary(day_counts, destination=None):
+    """Console view of a weekly goals report: tickets per day and difficulty"""
+    from rich.table import Table
+
+    table = Table(title="[bold magenta]Weekly goals summary[/bold magenta]", show_footer=True)
+    totals = {level: sum(counts[level] for counts in day_counts.values()) for level in DIFFICULTY_LEVELS + ['TOTAL']}
+    table.add_column("Day", footer="Grand Total")
+    for level in DIFFICULTY_LEVELS + ['TOTAL']:
+        table.add_column(level.title(), justify="right", footer=str(totals[level]))
+    for name, counts in day_counts.items():
+        table.add_row(name, *(str(counts[level]) for level in DIFFICULTY_LEVELS + ['TOTAL']))
+    console.print(table)
+    if destination:
+        console.print(f"[green]Full report written to {destination}[/green]")
+
+
+class WeeklyGoals:
+    """Weekly goals computed once, to be written by any of REPORT_FORMATS
+
+    rows holds one row per listed ticket in report order: days in order,
+    projects sorted within a day, tickets in export order. Its '_day' column
+    indexes into days.
+    """
+
+    kind = 'weekly_goals'
+
+    def __init__(self, days, rows, counts, author=None, week=None):
+        self.days = days
+        self.rows = rows
+        self.counts = counts
+        self.author = author
+        self.week = week or current_iso_week()
+
+    def iter_days(self):
+        """(day, [(project, [(issue, difficulty), ...]), ...]) for every day, empty days included"""
+        bounds = self.rows['_day'].to_numpy().searchsorted(range(len(self.days) + 1))
+        records = list(self.rows[['Project', 'Issue', DIFFICULTY_COLUMN]].itertuples(index=False, name=None))
+        for position, name in enumerate(self.days):
+            projects = []
+            for project, issue, difficulty in records[bounds[position]:bounds[position + 1]]:
+                if not projects or projects[-1][0] != project:
+                    projects.append((project, []))
+                projects[-1][1].append((issue, difficulty))
+            yield name, projects
+
+    def day_counts(self):
+        """Difficulty counts of every day keyed by day name, as stream_weekly_goals returns them"""
+        day_counts = {}
+        for position, name in enumerate(self.days):
+            rows = self.rows[self.rows['_day'] == position]
+            counts = rows[DIFFICULTY_COLUMN].value_counts()
+            day_counts[name] = {level: int(counts.get(level, 0)) for level in DIFFICULTY_LEVELS}
+            day_counts[name]['TOTAL'] = len(rows)
+        return day_counts
+
+    def to_dict(self):
+        return {
+            'type': self.kind, 'header': report_header(self.author, self.week),
+            'week': f"{self.week[0]}-W{self.week[1]:02d}",
+            'days': [
+                {'day': name, 'projects': [
+                    {'project': str(project), 'issues': [
+                        {'issue': str(issue), 'difficulty': _json_value(difficulty)} for issue, difficulty in issues]}
+                    for project, issues in projects]}
+                for name, projects in self.iter_days()
+            ],
+            'summary': self.counts,
+        }
+
+
+class EowSummary:
+    """End of week summary computed once: ticket counts per work type and difficulty"""
+
+    kind = 'eow_summary'
+
+    def __init__(self, counts, author=None, week=None, last_week=None):
+        self.counts = counts
+        self.author = author
+        self.week = week or current_iso_week()
+        self.last_week = last_week
+
+    def work_types(self):
+        """{work type: {difficulty: count}} for the work types the summary lists"""
+        return {work_type.value: {level: int(count) for level, count in _counts_for(self.counts, work_type.value).items()}
+                for work_type in (WorkType.REGULAR_HOUR, WorkType.OVERTIME)}
+
+    def to_dict(self):
+        last_week = self.last_week or self.week
+        return {
+            'type': self.kind, 'header': report_header(self.author, self.week, self.last_week),
+            'weeks': [f"{year}-W{week:02d}" for year, week in (self.week, last_week)],
+            'work_types': self.work_types(),
+        }
+
+
+def _json_value(value):
+    return None if value is None or value != value else str(value)
+
+
+@traced
+def build_weekly_goals(raw_data, author=None, week=None):
+    """Weekly goals model of process_data/merge_raws day buckets"""
+    return WeeklyGoals([name for name, _ in raw_data.values()], *goal_rows(raw_data), author, week)
+
+
+@traced
+def build_eow_summary(tasks_for_this_week, author=None, week=None):
+    """End of week summary model of one week's tasks"""
+    # Work type x difficulty counts in one pass
+    counts, _ = aggregate_difficulty(tasks_for_this_week, by='Work Type')
+    return EowSummary(counts, author, week)
+
+
+def write_text(report, out):
+    """The Slack-style text report"""
+    if isinstance(report, EowSummary):
+        write_eow_summary(report.counts, out, report.author, report.week, report.last_week)
+    else:
+        write_weekly_goals(day_blocks(report.days, report.rows), report.counts, out, report.author, report.week)
+
+
+def _markdown(text):
+    return re.sub(r'([\\`*_\[\]#|<>])', r'\\\1', str(text))
+
+
+def write_markdown(report, out):
+    """Headings per day, a bold line per project and a bullet per ticket"""
+    if isinstance(report, EowSummary):
+        out.write(f"## End of week summary\n\n{_markdown(report_header(report.author, report.week, report.last_week))}\n\n")
+        out.write("| Work type | " + " | ".join(DIFFICULTY_LEVELS) + " |\n")
+        out.write("|---" * (len(DIFFICULTY_LEVELS) + 1) + "|\n")
+        for work_type, counts in report.work_types().items():
+            out.write(f"| {work_type} | " + " | ".join(str(counts[level]) for level in DIFFICULTY_LEVELS) + " |\n")
+        return
+
+    out.write(f"## Weekly goals\n\n{_markdown(report_header(report.author, report.week))}\n")
+    for name, projects in report.iter_days():
+        out.write(f"\n### {name}\n\n")
+        if not projects:
+            out.write("_N/A_\n")
+        for project, issues in projects:
+            out.write(f"**{_markdown(project)}**\n\n")
+            for issue, difficulty in issues:
+                out.write(f"- {_markdown(issue)} — {_markdown(difficulty)}\n")
+            out.write("\n")
+    out.write("\n### Summary\n\n| Difficulty | Tickets |\n|---|---|\n")
+    for level in DIFFICULTY_LEVELS:
+        out.write(f"| {level} | {report.counts[level]} |\n")
+    out.write(f"| **Grand Total** | **{report.counts['TOTAL']}** |\n")
+
+
+def write_json(report, out):
+    """One JSON document per report, on a single line"""
+    json.dump(report.to_dict(), out, ensure_ascii=False)
+    out.write("\n")
+
+
+def write_csv(report, out):
+    """Weekly goals as one row per ticket, the summary as one row per work type and difficulty"""
+    if isinstance(report, EowSummary):
+        out.write("work_type,difficulty,tickets\n")
+        for work_type, counts in report.work_types().items():
+            for level in DIFFICULTY_LEVELS:
+                out.write(f"{work_type},{level},{counts[level]}\n")
+        return
+    rows = report.rows
+    table = pd.DataFrame({
+        'day': pd.Categorical.from_codes(rows['_day'].to_numpy(), categories=report.days) if report.days else [],
+        'project': rows['Project'].to_numpy(),
+        'issue': rows['Issue'].to_numpy(),
+        'difficulty': rows[DIFFICULTY_COLUMN].to_numpy(),
+    })
+    table.to_csv(out, index=False, lineterminator='\n')
+
+
+# Serializers by --format name; each writes a WeeklyGoals or EowSummary to a text stream
+REPORT_FORMATS = {'text': write_text, 'markdown': write_markdown, 'json': write_json, 'csv': write_csv}
+
+
+def write_report(report, out, fmt='text'):
+    REPORT_FORMATS[fmt](report, out)
+    
+# Exports bigger than this are filtered to the week chunk by chunk instead of loaded whole
+STREAMING_THRESHOLD_BYTES = 256 * 1024 * 1024
+STREAM_CHUNK_ROWS = 200_000
+
+
+def add_iso_week(df, column):
+    """Add the ISO 'Week' and 'Year' of a date column, unless this frame already has them
+
+    Only the column name is kept in df.attrs: pandas copies attrs into every
+    derived frame, so rows filtered or copied from this frame skip the work
+    too, while the columns themselves stay in the frame.
+    """
+    if df.attrs.get('iso_week_from') == column and {'Week', 'Year'} <= set(df.columns):
+        return df
+    dates = apply_schema(df)[column].dt.isocalendar()
+    df['Week'] = dates['week']
+    df['Year'] = dates['year']
+    df.attrs['iso_week_from'] = column
+    return df
+
+
+def _filter_this_week(df, week=None):
+    """Rows of an ISO (year, week), the current one by default, plus the column used to dedupe them"""
+    current_year, current_week = week or current_iso_week()
+
+    # Issue exports gain 'Week' here, so they must keep taking this branch when
+    # already filtered rows are filtered again
+    if 'Week' in df.columns and 'Start date' not in df.columns:
+        rows = df[df['Week'] == current_week]
+        if 'Date' in rows.columns:
+            # 'Week' carries no year, so the same week of other years is cut by
+            # date, as the week index does; rows without a date only have 'Week'
+            # to go by and are kept
+            year = apply_schema(rows)['Date'].dt.isocalendar()['year']
+            rows = rows[year.isna() | (year == current_year)]
+        return rows, 'Issue'
+    elif 'Start date' in df.columns:
+        add_iso_week(df, 'Start date')
+        # print("COLUMNS!!!" + df.columns)
+        return df[(df['Week'] == current_week) & (df['Year'] == current_year)], '#'
+    else:
+        # If neither column exists, return empty DataFrame or raise an error
+        return pd.DataFrame(columns=df.columns), None
+
+
+@traced
+def extract_data_from_this_week(df, week=None):
+    progress_stage("Extracting current week redmines...", len(df), 'rows')
+    tasks_this_week, key = _filter_this_week(df, week)
+    if key is not None:
+        tasks_this_week = tasks_this_week.drop_duplicates(subset=[key])
+    progress_advance(len(df))
+
+    return tasks_this_week
+
+
+@traced
+def stream_data_from_this_week(file_path, chunksize=STREAM_CHUNK_ROWS, dedupe=True, week=None):
+    """Same rows as extract_data_from_this_week without loading the whole export
+
+    Only EXPORT_COLUMNS are parsed and each chunk is cut down to the current week
+    before the next one is read, so memory is bounded by the chunk size.
+    """
+    for options in _read_attempts(file_path):
+        try:
+            matches, key = [], None
+            with open_export(file_path) as source:
+                with pd.read_csv(source, chunksize=chunksize, **EXPORT_READ_OPTIONS, **options) as reader:
+                    for chunk in reader:
+                        rows, key = _filter_this_week(apply_schema(chunk), week)
+                        matches.append(rows)
+            break
+        except UnicodeDecodeError:
+            continue
+
+    tasks_this_week = apply_schema(pd.concat(matches)) if matches else pd.DataFrame()
+    if dedupe and key is not None:
+        tasks_this_week = tasks_this_week.drop_duplicates(subset=[key])
+
+    return tasks_this_week
+
+
+# Per-export (ISO year, ISO week) partitions live under the cache directory
+INDEX_DIR = os.path.join(CACHE_DIR, 'index')
+USE_WEEK_INDEX = True
+# Bytes before the old end of an export that must be unchanged for an append-only update
+INDEX_EDGE_BYTES = 4096
+
+
+def _hash_range(file_path, start, length):
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        return hashlib.blake2b(f.read(length), digest_size=16).hexdigest()
+
+
+def _edge_hash(file_path, size):
+    edge_start = max(0, size - INDEX_EDGE_BYTES)
+    return _hash_range(file_path, edge_start, size - edge_start)
+
+
+def appended_since(file_path, state, stat):
+    """True when an export only grew since state was recorded and its old bytes are unchanged"""
+    return (
+        stat.st_size > state['size']
+        and _hash_range(file_path, 0, FINGERPRINT_SAMPLE_BYTES) == state['head_hash']
+        and _edge_hash(file_path, state['size']) == state['edge_hash']
+    )
+
+
+def read_appended_rows(file_path, state, chunksize=STREAM_CHUNK_ROWS):
+    """Yield chunks of the rows written after state['size'], parsed with the original header"""
+    with open(file_path, 'rb') as f:
+        f.seek(state['size'])
+        with pd.read_csv(f, encoding=state['encoding'], encoding_errors=state.get('encoding_errors', 'strict'),
+                         header=None, names=state['columns'], chunksize=chunksize, **EXPORT_READ_OPTIONS) as reader:
+            for chunk in reader:
+                yield apply_schema(chunk)
+
+
+def _index_dir(file_path):
+    path_key = hashlib.blake2b(os.path.abspath(file_path).encode(), digest_size=8).hexdigest()
+    return os.path.join(INDEX_DIR, path_key)
+
+
+def _date_column(columns):
+    if 'Start date' in columns:
+        return 'Start date'
+    if 'Date' in columns:
+        return 'Date'
+    return None
+
+
+# Partition of rows whose date is missing, read with every week
+UNDATED_PARTITION = 'undated'
+
+
+def _add_partitions(index, directory, chunks):
+    """Split each chunk by ISO (year, week) and write every group as a new part file"""
+    for chunk in chunks:
+        # Label rows by their position in the whole export, as a full parse would
+        chunk.index = pd.RangeIndex(index['rows'], index['rows'] + len(chunk))
+        index['rows'] += len(chunk)
+        dates = chunk[index['date_column']].dt.isocalendar()
+        for (year, week), rows in chunk.groupby([dates['year'], dates['week']], sort=False):
+            name = f"{year}-{week:02d}-{index['next_part']:05d}.pkl"
+            index['next_part'] += 1
+            rows.to_pickle(os.path.join(directory, name))
+            index['partitions'].setdefault(f"{year}-{week}", []).append(name)
+        undated = chunk[chunk[index['date_column']].isna()]
+        if len(undated):
+            name = f"{UNDATED_PARTITION}-{index['next_part']:05d}.pkl"
+            index['next_part'] += 1
+            undated.to_pickle(os.path.join(directory, name))
+            index['partitions'].setdefault(UNDATED_PARTITION, []).append(name)
+
+
+def _build_week_index(file_path, directory, chunksize):
+    """Stream a whole export into fresh partitions, trying each encoding as parse_csv does
+
+    The encoding that decoded every row is kept in the index for appended
+    rows. Returns None when the export has no date column.
+    """
+    for options in _read_attempts(file_path):
+        shutil.rmtree(directory, ignore_errors=True)
+        os.makedirs(directory)
+        try:
+            columns = list(pd.read_csv(file_path, nrows=0, **options).columns)
+            if _date_column(columns) is None:
+                return None
+            index = {
+                'version': CACHE_VERSION, 'encoding': options['encoding'],
+                'encoding_errors': options.get('encoding_errors', 'strict'), 'columns': columns,
+                'date_column': _date_column(columns), 'rows': 0, 'next_part': 0, 'partitions': {},
+                'head_hash': _hash_range(file_path, 0, FINGERPRINT_SAMPLE_BYTES),
+            }
+            with open_export(file_path) as source:
+                with pd.read_csv(source, chunksize=chunksize, **EXPORT_READ_OPTIONS, **options) as reader:
+                    _add_partitions(index, directory, map(apply_schema, reader))
+            return index
+        except UnicodeDecodeError:
+            continue
+
+
+@traced
+def update_week_index(file_path, chunksize=STREAM_CHUNK_ROWS):
+    """Build or extend the week index of an export and return it
+
+    A fresh index streams the whole export once. When the export only grew
+    and its old bytes are unchanged, just the appended tail is parsed and its
+    rows become new parts. Returns None when the export has no date column,
+    or when the cache directory is not private to this user.
+    """
+    try:
+        make_cache_dir()
+    except OSError:
+        return None
+    if not cache_dir_trusted():
+        return None
+    directory = _index_dir(file_path)
+    index_path = os.path.join(directory, 'index.json')
+    stat = os.stat(file_path)
+    try:
+        with open(index_path) as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        index = None
+
+    if index is not None and index['version'] == CACHE_VERSION:
+        if (index['size'], index['mtime_ns']) == (stat.st_size, stat.st_mtime_ns):
+            # Touch the index so eviction drops the least recently used ones first
+            with contextlib.suppress(OSError):
+                os.utime(index_path)
+            return index
+        if not appended_since(file_path, index, stat):
+            index = None
+    else:
+        index = None
+
+    if index is not None:
+        try:
+            _add_partitions(index, directory, read_appended_rows(file_path, index, chunksize))
+        except UnicodeDecodeError:
+            # The appended rows need another encoding; index the whole export again
+            index = None
+    if index is None:
+        index = _build_week_index(file_path, directory, chunksize)
+        if index is None:
+            return None
+
+    index.update(size=stat.st_size, mtime_ns=stat.st_mtime_ns, edge_hash=_edge_hash(file_path, stat.st_size))
+    with open(index_path + '.tmp', 'w') as f:
+        json.dump(index, f)
+    os.replace(index_path + '.tmp', index_path)
+    evict_cache(keep=directory)
+    return index
+
+
+@traced
+def load_indexed_week(file_path, year, week):
+    """Rows of one ISO week read from the export's partitions, or None if it has no index"""
+    index = update_week_index(file_path)
+    if index is None:
+        return None
+    directory = _index_dir(file_path)
+    names = index['partitions'].get(f"{year}-{week}", [])
+    undated = index['partitions'].get(UNDATED_PARTITION, [])
+    try:
+        parts = [pd.read_pickle(os.path.join(directory, name)) for name in names + undated]
+    except FileNotFoundError:
+        # Evicted by a parallel load since it was brought up to date
+        return None
+    if not parts:
+        return pd.DataFrame(columns=[column for column in index['columns'] if column in EXPORT_COLUMNS])
+    rows = pd.concat(parts)
+    if undated:
+        # Undated rows may still carry a 'Week'; keep every row in export order
+        rows = rows.sort_index(kind='stable')
+    return apply_schema(rows)
+
+
+@traced
+def load_week_rows(csv_path, week=None):
+    """Rows of an export that can fall in the given (default current) week, not yet deduped"""
+    if USE_WEEK_INDEX:
+        iso_year, iso_week = week or current_iso_week()
+        week_rows = load_indexed_week(csv_path, iso_year, iso_week)
+        if week_rows is not None:
+            console.print(f"[green]Loaded week {iso_week} from index: {csv_path} ({len(week_rows)} rows)[/green]")
+            return week_rows
+
+    if os.path.getsize(csv_path) > STREAMING_THRESHOLD_BYTES:
+        console.print(f"[green]Streaming large export: {csv_path}[/green]")
+        return stream_data_from_this_week(csv_path, dedupe=False, week=week)
+    return read_csv_file(csv_path)
+
 
+def load_this_week(csv_path, week=None):
+    """One week's rows of an export (the current one by default), from its week index when it has one"""
+    return extract_data_from_this_week(load_week_rows(csv_path, week), week)
 
-class WorkType(Enum):
-    OVERTIME = "Overtime"
-    REGULAR_HOUR = "Regular Hour"
 
+# One rollup row per (year, week, user, project, work type, difficulty)
+ROLLUP_KEYS = ['Year', 'Week', 'User', 'Project', 'Work Type', DIFFICULTY_COLUMN]
 
 
-def print_summary(df):
-    easy = 0
-    normal = 0
-    hard = 0
-    total = 0
+@traced
+def build_rollup(df):
+    """Ticket counts and hours of a whole export per ROLLUP_KEYS combination
 
-    raw = {
-        Difficulty.EASY: ('EASY', df[df['Level of Difficulty (Dev)'] == 'EASY']),
-        Difficulty.NORMAL: ('NORMAL', df[df['Level of Difficulty (Dev)'] == 'NORMAL']),
-        Difficulty.HARD: ('HARD', df[df['Level of Difficulty (Dev)'] == 'HARD'])
-    }
+    'Tickets' counts a ticket once per user and week, as a --user report
+    lists it. 'Team Tickets' counts it once per week, on the first row the
+    export lists, as the whole team's weekly report does. Both carry the
+    hours of all the ticket's time entries in that week.
+    """
+    date_column = _date_column(df.columns)
+    if date_column is None:
+        raise ValueError("Export has neither a 'Start date' nor a 'Date' column")
+    key = '#' if date_column == 'Start date' else 'Issue'
+    user = next((column for column in USER_COLUMNS if column in df.columns), None)
+    dates = apply_schema(df)[date_column].dt.isocalendar()
 
-    for level_enum, (level_name, level_df) in raw.items():
-        count = len(level_df)
-        if level_name == "EASY":
-            easy += count
-        elif level_name == "NORMAL":
-            normal += count
-        elif level_name == "HARD":
-            hard += count
-        total += count
-    print()
-    print(f"SUMMARY:")
-    print(f"EASY: {easy}")
-    print(f"NORMAL: {normal}")
-    print(f"HARD: {hard}")
-    print(f"Grand Total: {total}")
+    rows = pd.DataFrame({
+        'Year': dates['year'],
+        'Week': dates['week'],
+        'User': df[user] if user else None,
+        'Project': df.get('Project'),
+        'Work Type': df.get('Work Type'),
+        DIFFICULTY_COLUMN: df.get(DIFFICULTY_COLUMN),
+        '_ticket': df[key],
+        'Hours': df['Hours'] if 'Hours' in df.columns else 0.0,
+    }).dropna(subset=['Year', 'Week'])
 
+    ticket = ['Year', 'Week', 'User', '_ticket']
+    rows['Hours'] = rows.groupby(ticket, dropna=False)['Hours'].transform('sum')
+    tickets = rows.drop_duplicates(subset=ticket)
+    tickets = tickets.assign(_first=~tickets.duplicated(subset=['Year', 'Week', '_ticket']))
+    return (
+        tickets.groupby(ROLLUP_KEYS, dropna=False, observed=True)
+        .agg(Tickets=('_ticket', 'size'), **{'Team Tickets': ('_first', 'sum')}, Hours=('Hours', 'sum'))
+        .reset_index()
+    )
 
-def print_eow_summary(tasks_for_this_week):
-    # Separate by work type first
-    today = date.today()
-    iso_year, iso_week, _ = today.isocalendar()
-    # Calculate Monday of the ISO week
-    monday = date.fromisocalendar(iso_year, iso_week, 1)  # 1 = Monday
-    # Calculate Friday of the ISO week
-    friday = date.fromisocalendar(iso_year, iso_week, 5)  # 5 = Friday
-    month_name = monday.strftime("%B")
-
-
-    work_types = {
-        WorkType.REGULAR_HOUR: tasks_for_this_week[tasks_for_this_week['Work Type'] == 'Regular Hour'],
-        WorkType.OVERTIME: tasks_for_this_week[tasks_for_this_week['Work Type'] == 'Overtime']
-    }
 
-    output.write("\n")
-    output.write("END OF WEEK SUMMARY:\n")
+def load_rollup(file_path):
+    """Rollup table of an export, built once and then served from the cache"""
+    rollup = load_cached_frame(file_path, kind='rollup')
+    if rollup is None:
+        rollup = build_rollup(read_csv_file(file_path))
+        store_cached_frame(file_path, rollup, kind='rollup')
+    return rollup
 
 
-    output.write(f"Ubag, Andrew - JWD - {month_name} {monday.day}-{friday.day}, {iso_year}\n")
-    output.write("\n")
+def rollup_difficulty(rollup, weeks, user=None):
+    """Work type x difficulty ticket counts and hours over some weeks of a rollup"""
+    wanted = {year * 100 + week for year, week in weeks}
+    selected = rollup[(rollup['Year'] * 100 + rollup['Week']).isin(wanted)]
+    tickets = 'Team Tickets'
+    if user is not None:
+        selected = selected[selected['User'] == user]
+        tickets = 'Tickets'
+    grouped = selected.groupby(['Work Type', DIFFICULTY_COLUMN], observed=True)[[tickets, 'Hours']].sum()
+    counts = _difficulty_matrix(grouped[tickets], 0).astype(int)
+    return counts, _difficulty_matrix(grouped['Hours'], 0.0)
 
-    for work_type_enum, work_type_df in work_types.items():
-        easy = 0
-        normal = 0
-        hard = 0
 
-        # Filter by difficulty within each work type
-        raw = {
-            Difficulty.EASY: ('EASY', work_type_df[work_type_df['Level of Difficulty (Dev)'] == 'EASY']),
-            Difficulty.NORMAL: ('NORMAL', work_type_df[work_type_df['Level of Difficulty (Dev)'] == 'NORMAL']),
-            Difficulty.HARD: ('HARD', work_type_df[work_type_df['Level of Difficulty (Dev)'] == 'HARD'])
-        }
+def load_report_frames(inputs, week=None, user=None):
+    """One week of every export, deduped, optionally narrowed to one user's rows"""
+    frames = []
+    for path in inputs:
+        rows = load_week_rows(path, week)
+        if user is not None:
+            rows = split_by_user(rows).get(user, rows.iloc[:0])
+        frames.append(extract_data_from_this_week(rows, week))
+    return frames
 
-        for level_enum, (level_name, level_df) in raw.items():
-            count = len(level_df)
-            if level_name == "EASY":
-                easy += count
-            elif level_name == "NORMAL":
-                normal += count
-            elif level_name == "HARD":
-                hard += count
 
-        # Print results for this work
-        output.write("\n")
-        output.write(f"{work_type_enum.value}:\n")
-        output.write(f"EASY: {easy}\n")
-        output.write(f"NORMAL: {normal}\n")
-        output.write(f"HARD: {hard}\n")
+# Local SQLite store that exports can be ingested into and reports read from
+STORE_PATH = 'wgg.sqlite3'
+# Export column -> store column of each table; rows are keyed by time entry id or issue number
+STORE_TABLES = {
+    'timelog': ('time_entries', 'entry_id', {
+        'Date': 'date', 'User': 'user', 'Project': 'project', 'Issue': 'issue',
+        'Tracker': 'tracker', 'Status': 'status', 'Hours': 'hours',
+        DIFFICULTY_COLUMN: 'difficulty', 'Work Type': 'work_type',
+    }),
+    'issues': ('issues', 'issue_no', {
+        '#': 'issue_no', 'Start date': 'start_date', 'Assignee': 'assignee', 'Project': 'project',
+        'Tracker': 'tracker', 'Status': 'status', 'Subject': 'subject',
+        DIFFICULTY_COLUMN: 'difficulty', 'Work Type': 'work_type',
+    }),
+}
+STORE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS time_entries (
+    entry_id TEXT PRIMARY KEY, year_week INTEGER, date TEXT, user TEXT, project TEXT,
+    issue TEXT, tracker TEXT, status TEXT, hours REAL, difficulty TEXT, work_type TEXT,
+    row_hash INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS time_entries_week ON time_entries (year_week);
+CREATE INDEX IF NOT EXISTS time_entries_user ON time_entries (user, year_week);
+CREATE INDEX IF NOT EXISTS time_entries_project ON time_entries (project, year_week);
+CREATE TABLE IF NOT EXISTS issues (
+    issue_no INTEGER NOT NULL UNIQUE, year_week INTEGER, start_date TEXT, assignee TEXT,
+    project TEXT, tracker TEXT, status TEXT, subject TEXT, difficulty TEXT, work_type TEXT,
+    row_hash INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS issues_week ON issues (year_week);
+CREATE INDEX IF NOT EXISTS issues_user ON issues (assignee, year_week);
+CREATE INDEX IF NOT EXISTS issues_project ON issues (project, year_week);
+CREATE TABLE IF NOT EXISTS ingested_files (
+    path TEXT PRIMARY KEY, fingerprint TEXT NOT NULL, kind TEXT NOT NULL,
+    rows INTEGER NOT NULL, ingested_at TEXT NOT NULL
+);
+"""
+# Bumped when stored keys change; older stores are emptied and re-ingested
+STORE_VERSION = 2
+# Table each report reads, in the order its exports are passed
+STORE_KINDS = {'goals': ['timelog'], 'compare': ['timelog', 'issues'], 'eow': ['timelog']}
 
 
+def open_store(db_path=STORE_PATH):
+    import sqlite3
 
-    formatted_output = output.getvalue()
-    pyperclip.copy(formatted_output)
-    console.print(formatted_output)
-    console.print("[green]Output successfully copied to clipboard 📋📋📋[/green]")
+    conn = sqlite3.connect(db_path)
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version != STORE_VERSION:
+        # Rows keyed the old way would never match again, so start over
+        conn.executescript("DROP TABLE IF EXISTS time_entries; DROP TABLE IF EXISTS issues; "
+                           "DROP TABLE IF EXISTS ingested_files;")
+    conn.executescript(STORE_SCHEMA)
+    conn.execute(f"PRAGMA user_version = {STORE_VERSION}")
+    return conn
 
 
-def read_csv_file(file_path):
+def _store_records(df, kind):
+    """Rows of an export shaped like its store table, with key, year_week and row_hash"""
+    table, key, columns = STORE_TABLES[kind]
+    date_column = 'Start date' if kind == 'issues' else 'Date'
+    records = pd.DataFrame(index=df.index)
+    for export_column, column in columns.items():
+        values = df[export_column] if export_column in df.columns else pd.Series(None, index=df.index, dtype=object)
+        if export_column == date_column:
+            values = values.dt.strftime('%Y-%m-%d')
+        records[column] = values.astype(object)
+    dates = df[date_column].dt.isocalendar()
+    records['year_week'] = (dates['year'] * 100 + dates['week']).astype(object)
+    records['row_hash'] = pd.util.hash_pandas_object(records, index=False).astype('int64')
 
-    encodings = ['utf-8', 'latin-1', 'windows-1252', 'iso-8859-1', 'cp1252']
-    
-    for encoding in encodings:
-        try:
-            print(f"Trying encoding: {encoding}")
-            pd.read_csv(file_path, encoding=encoding)
-            console.print(f"[green]Successfully read with encoding: {encoding}[/green]")
-            break
-        except UnicodeDecodeError:
-            continue
-    else:
-        # If none of the encodings work, try with error handling
-        try:
-            pd.read_csv(file_path, encoding='utf-8')
-            console.print(f"[green]Read with UTF-8 and ignored errors[/green]")
-        except Exception as e:
-            console.print(f"[red]Failed to read file with any encoding:[/red] : {e}")
-            # print(f"Failed to read file with any encoding: {e}")
-            return None
-    
+    if kind == 'timelog':
+        # Redmine's timelog export has no entry id, so an entry is keyed by the
+        # fields an edit leaves alone (date, user, issue) plus its occurrence
+        # number among entries sharing them, which is stable across re-exports.
+        # Hours, difficulty, work type and status stay out of the key, so an
+        # edited entry updates its row instead of adding another
+        identity = pd.util.hash_pandas_object(records[['date', 'user', 'issue']], index=False)
+        occurrence = identity.groupby(identity, sort=False).cumcount()
+        records[key] = identity.map('{:016x}'.format) + '-' + occurrence.astype(str)
+    records = records.dropna(subset=[key]).drop_duplicates(subset=[key], keep='last')
+    return records.astype(object).where(records.notna(), None)
+
+
+def ingest_export(file_path, db_path=STORE_PATH):
+    """Upsert an export into the store and return (kind, rows, new or changed rows, removed rows)
+
+    Unchanged files are skipped by fingerprint and unchanged rows by their
+    hash, so ingesting the same export again writes nothing. When a path
+    ingested before comes back changed, stored rows within the export's date
+    span that it no longer lists are deleted.
+    """
+    fingerprint = file_fingerprint(file_path)
+    conn = open_store(db_path)
     try:
-        # Read the CSV file
-        df = pd.read_csv(file_path)
-        
-        
-        # Display basic information about the dataset
-        console.print(f"[green]Successfully loaded CSV file: {file_path}[/green]")
-        console.print(f"[white on magenta]Shape: {df.shape} (rows, columns)[/white on magenta]")
-        columns = list(df.columns)
-        colors = ["red", "green", "yellow", "blue", "magenta", "cyan", "white"]
-        styled_columns = [
-            f"[{colors[i % len(colors)]}]{col}[/]" for i, col in enumerate(columns)
-        ]
-        console.print(Columns(styled_columns))
-        print()
-        # print("\nFirst 5 rows:")
-        # print(df.head())
-        
-        return df
-        
-    except FileNotFoundError:
-        print(f"Error: File '{file_path}' not found.")
-        return None
-    except pd.errors.EmptyDataError:
-        print(f"Error: The file '{file_path}' is empty.")
-        return None
-    except Exception as e:
-        print(f"Error reading file: {e}")
-        return None
-    
-    
-def print_output(raw_data):
-    easy = 0
-    normal = 0
-    hard = 0
-    total = 0   
-    today = date.today()
-    iso_year, iso_week, _ = today.isocalendar()
-
-    # Calculate Monday of the ISO week
-    monday = date.fromisocalendar(iso_year, iso_week, 1)  # 1 = Monday
-
-    # Calculate Friday of the ISO week
-    friday = date.fromisocalendar(iso_year, iso_week, 5)  # 5 = Friday 
-    
-    month_name = monday.strftime("%B")
-    
-    output.write("*WEEKLY GOALS*\n")
-    output.write(f"Ubag, Andrew - JWD - {month_name} {monday.day}-{friday.day}, {iso_year}\n")
-    output.write("\n")
-    for day_enum, (day_name, day_df) in raw_data.items():
-        # if day_name not in ("SATURDAY", "SUNDAY"):
-        output.write(f"*{day_name}*\n")
-        
-        if not {'Project', 'Issue'}.issubset(day_df.columns):
-            output.write("_N/A_\n\n")
-            continue
-        
-        # Drop rows with missing 'Project' or 'Issue' (optional, for cleaner output)
-        day_df = day_df.dropna(subset=['Project', 'Issue'])
-        
-        if day_df.empty:
-            output.write("_N/A_\n\n")
-            continue
+        previous = conn.execute("SELECT kind, rows, fingerprint FROM ingested_files WHERE path = ?",
+                                (os.path.abspath(file_path),)).fetchone()
+        if previous and previous[2] == fingerprint:
+            return previous[0], previous[1], 0, 0
 
-        # Group by 'Project'
-        for project, group in day_df.groupby('Project'):
-            output.write(f"_*{project}*_\n")
-            for _, row in group.iterrows():
-                issue = row['Issue']
-                difficulty = row['Level of Difficulty (Dev)']
-                if difficulty == "EASY":
-                 easy += 1
-                elif difficulty == "NORMAL":
-                    normal += 1
-                elif difficulty == "HARD":
-                    hard += 1
-                total += 1
-
-                output.write(f"• {issue} - {difficulty}\n")
-            output.write("\n")
-          # newline for readability
-        
-        
+        df = read_csv_file(file_path)
+        if df is None:
+            raise ValueError(f"Could not read {file_path}")
+        kind = 'issues' if 'Start date' in df.columns else 'timelog'
+        if kind == 'timelog' and 'Date' not in df.columns:
+            raise ValueError(f"{file_path} has neither a 'Start date' nor a 'Date' column")
+        table, key, _ = STORE_TABLES[kind]
+        records = _store_records(df, kind)
 
+        names = list(records.columns)
+        updates = ', '.join(f"{name} = excluded.{name}" for name in names if name != key)
+        upsert = (f"INSERT INTO {table} ({', '.join(names)}) VALUES ({', '.join('?' * len(names))}) "
+                  f"ON CONFLICT ({key}) DO UPDATE SET {updates} WHERE {table}.row_hash != excluded.row_hash")
+        date_column = STORE_TABLES[kind][2]['Start date' if kind == 'issues' else 'Date']
+        with conn:
+            before = conn.total_changes
+            conn.executemany(upsert, records.itertuples(index=False, name=None))
+            changed = conn.total_changes - before
+            removed = 0
+            dates = records[date_column].dropna()
+            if previous and previous[0] == kind and len(dates):
+                # Entries deleted from the export; a deletion also renumbers the
+                # occurrence keys of later entries sharing its date, user and issue
+                conn.execute("CREATE TEMP TABLE IF NOT EXISTS ingested_keys (key PRIMARY KEY)")
+                conn.execute("DELETE FROM ingested_keys")
+                conn.executemany("INSERT OR IGNORE INTO ingested_keys VALUES (?)", ((value,) for value in records[key]))
+                removed = conn.execute(
+                    f"DELETE FROM {table} WHERE {date_column} BETWEEN ? AND ? "
+                    f"AND {key} NOT IN (SELECT key FROM ingested_keys)", (dates.min(), dates.max())).rowcount
+            conn.execute("INSERT OR REPLACE INTO ingested_files VALUES (?, ?, ?, ?, datetime('now'))",
+                         (os.path.abspath(file_path), fingerprint, kind, len(records)))
+        return kind, len(records), changed, removed
+    finally:
+        conn.close()
+
+
+def query_store(kind, weeks, user=None, db_path=STORE_PATH):
+    """Rows of the given ISO weeks from the store, with the columns of the export they came from"""
+    table, _, columns = STORE_TABLES[kind]
+    user_column = 'assignee' if kind == 'issues' else 'user'
+    year_weeks = [year * 100 + week for year, week in weeks]
+    select = ', '.join(f'{column} AS "{export_column}"' for export_column, column in columns.items())
+    sql = f"SELECT {select}, year_week % 100 AS Week FROM {table} WHERE year_week IN ({', '.join('?' * len(year_weeks))})"
+    params = year_weeks
+    if user is not None:
+        sql += f" AND {user_column} = ?"
+        params = year_weeks + [user]
+    # Rows come back in the order they were first ingested, as the export listed them
+    sql += " ORDER BY rowid"
+
+    conn = open_store(db_path)
+    try:
+        df = pd.read_sql_query(sql, conn, params=params)
+    finally:
+        conn.close()
+    if kind == 'issues':
+        df = df.drop(columns='Week')
+    return apply_schema(df)
 
-        
-    output.write(f"SUMMARY:\n")   
-    output.write(f"EASY: {easy}\n")
-    output.write(f"NORMAL: {normal}\n")
-    output.write(f"HARD: {hard}\n")
-    output.write(f"Grand Total: {total}\n")
-    
-    formatted_output = output.getvalue()
-    pyperclip.copy(formatted_output)
-    console.print(formatted_output)
-    console.print("[green]Output successfully copied to clipboard 📋📋📋[/green]")
-    
-def extract_data_from_this_week(df):
-    today = date.today()
-    current_week = today.isocalendar().week
-    # current_week = 32
-    current_year = today.isocalendar().year
-
-    if 'Week' in df.columns:
-        tasks_this_week = df[df['Week'] == current_week].drop_duplicates(subset=['Issue'])
-    elif 'Start date' in df.columns:
-        # Ensure 'Start date' is datetime
-        df['Start date'] = pd.to_datetime(df['Start date'], errors='coerce')
-        df['Week'] = df['Start date'].dt.isocalendar().week
-        df['Year'] = df['Start date'].dt.isocalendar().year
-        # print("COLUMNS!!!" + df.columns)
-        tasks_this_week = df[(df['Week'] == current_week) & (df['Year'] == current_year)].drop_duplicates(subset=['#'])
-    else:
-        # If neither column exists, return empty DataFrame or raise an error
-        tasks_this_week = pd.DataFrame(columns=df.columns)
 
-    return tasks_this_week    
+def store_report_frames(command, week=None, user=None, db_path=STORE_PATH):
+    """Same frames as load_report_frames, read from the store instead of the exports"""
+    week = week or current_iso_week()
+    return [extract_data_from_this_week(query_store(kind, [week], user, db_path), week)
+            for kind in STORE_KINDS[command]]
+
+
+WORKDAYS = [
+    Workweek.MONDAY,
+    Workweek.TUESDAY,
+    Workweek.WEDNESDAY,
+    Workweek.THURSDAY,
+    Workweek.FRIDAY,
+]
+DAY_NAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+
+def _equals_ignoring_case(column, value):
+    """Case-insensitive equality on a categorical, lowercasing each category once"""
+    hits = np.append(column.cat.categories.str.lower() == value, False)
+    # Missing values have code -1 and pick the trailing False
+    return hits[column.cat.codes.to_numpy()]
+
+
+@traced
 def process_data(tasks_this_week):
     
     reference_date = 'Date'
@@ -299,7 +1882,7 @@ def process_data(tasks_this_week):
         required_issue_cols = {'Tracker', '#', 'Subject'}
         if required_issue_cols.issubset(tasks_this_week.columns):
             tasks_this_week['Issue'] = (
-                tasks_this_week['Tracker'].fillna('').astype(str) +
+                tasks_this_week['Tracker'].astype(object).fillna('').astype(str) +
                 ' #' +
                 tasks_this_week['#'].fillna('').astype(str) +
                 ': ' +
@@ -309,69 +1892,93 @@ def process_data(tasks_this_week):
             tasks_this_week['Issue'] = pd.NA 
         # print('test')
         
-    tasks_this_week[reference_date] = pd.to_datetime(tasks_this_week[reference_date], errors='coerce')
-    tasks_this_week['Day'] = tasks_this_week[reference_date].dt.day_name()
-    
-
+    progress_stage("Generating weekly goals...", len(tasks_this_week), 'rows')
+    apply_schema(tasks_this_week)
+    # Day of week as an integer (Monday == 0) computed once; NaT becomes -1
+    weekday = tasks_this_week[reference_date].dt.dayofweek.fillna(-1).astype(int).to_numpy()
+    tasks_this_week['Day'] = pd.Categorical.from_codes(weekday, categories=DAY_NAMES)
 
-    # print("Rows before date conversion:", len(tasks_this_week))
-    # print("Parsed reference date:", tasks_this_week[reference_date].head())
-    # print("Day column:", tasks_this_week['Day'].unique())
-    # print("Tracker values:", tasks_this_week['Tracker'].unique())
     # Filter out rows where 'tracker' is 'deployment'
-    filtered = tasks_this_week[(tasks_this_week['Tracker'].str.lower() != 'deployment') & (tasks_this_week['Status'].str.lower() != 'deploy request')]
-
-    days = [
-        (Workweek.MONDAY, 'Monday'),
-        (Workweek.TUESDAY, 'Tuesday'),
-        (Workweek.WEDNESDAY, 'Wednesday'),
-        (Workweek.THURSDAY, 'Thursday'),
-        (Workweek.FRIDAY, 'Friday'),
-    ]
+    keep = ~(_equals_ignoring_case(tasks_this_week['Tracker'], 'deployment')
+             | _equals_ignoring_case(tasks_this_week['Status'], 'deploy request'))
+    filtered = tasks_this_week[keep]
 
+    # Split into weekday buckets in a single groupby pass
+    buckets = dict(iter(filtered.groupby(weekday[keep], sort=False)))
     raw = {
-        key: (name.upper(), filtered[filtered['Day'] == name])
-        for key, name in days
+        key: (key.name, buckets.get(key.value - 1, filtered.iloc[:0]))
+        for key in WORKDAYS
     }
-    
-    # print(filtered['Issue'])
+    progress_advance(len(tasks_this_week))
     
     return raw
 
 
-def merge_raws(raw1, raw2):
-    merged = {}
-    seen_ids = set()
-    
-    
-    ordered_keys = [
-        Workweek.MONDAY,
-        Workweek.TUESDAY,
-        Workweek.WEDNESDAY,
-        Workweek.THURSDAY,
-        Workweek.FRIDAY,
-    ]
+def _issue_key(df):
+    """Issue number of every row, falling back to the whole 'Issue' text"""
+    # Timelog rows carry 'Bug #123: ...' and issue rows get the same shape from
+    # process_data, so the number after '#' identifies a ticket in both exports
+    number = df['Issue'].str.extract(r'#(\d+)', expand=False)
+    return number.where(number.notna(), df['Issue'])
 
-    for key in ordered_keys:
-        name = raw1[key][0]
-        df1 = raw1[key][1]
-        df2 = raw2[key][1]
 
-        # combined_df = pd.concat([df1, df2], ignore_index=True).drop_duplicates()
-        frames = [df for df in [df1, df2] if not df.empty]
-        combined_df = pd.concat(frames, ignore_index=True).drop_duplicates() if frames else pd.DataFrame()
-        
-        if not combined_df.empty:
-            combined_df = combined_df[~combined_df['Issue'].isin(seen_ids)]
-            seen_ids.update(combined_df['Issue'])
+@traced
+def merge_raws(*raws):
+    """Merge the day buckets of any number of exports, listing each ticket once
 
+    Tickets are matched on their issue number rather than whole-row equality.
+    A ticket stays on the first weekday it appears, and within a day the
+    earlier export wins.
+    """
+    # Day-major order so a single duplicated() pass implements "first day wins"
+    frames = [
+        raw[key][1].assign(_day=position)
+        for position, key in enumerate(WORKDAYS)
+        for raw in raws
+        if not raw[key][1].empty
+    ]
+    buckets = {}
+    if frames:
+        combined = pd.concat(frames, ignore_index=True)
+        combined = combined[~_issue_key(combined).duplicated()]
+        buckets = dict(iter(combined.groupby('_day', sort=False)))
 
-        merged[key] = (name, combined_df)
+    merged = {}
+    for position, key in enumerate(WORKDAYS):
+        name = raws[0][key][0]
+        if position in buckets:
+            merged[key] = (name, buckets[position].drop(columns='_day').reset_index(drop=True))
+        else:
+            merged[key] = (name, pd.DataFrame())
 
     return merged
+
+
+def iter_merged_days(*raws):
+    """Yield (key, (name, frame)) for each workday of the merged exports in order
+
+    Same rows as merge_raws, but only one merged day exists at a time. The
+    rows to keep are found in one duplicated() pass over the issue keys of
+    every day stacked in day-major order; each day is then cut from that mask.
+    """
+    days = [[raw[key][1] for raw in raws if not raw[key][1].empty] for key in WORKDAYS]
+    frames = [frame for day in days for frame in day]
+    keep = None
+    if frames:
+        keep = ~pd.concat([_issue_key(frame) for frame in frames], ignore_index=True).duplicated().to_numpy()
+    start = 0
+    for key, day_frames in zip(WORKDAYS, days):
+        kept = []
+        for frame in day_frames:
+            kept.append(frame[keep[start:start + len(frame)]])
+            start += len(frame)
+        day = pd.concat(kept, ignore_index=True) if kept else pd.DataFrame()
+        yield key, (raws[0][key][0], day if not day.empty else pd.DataFrame())
     
 def generate_weekly_goals():
     """Handle weekly goals generation"""
+    from rich.panel import Panel
+
     logger.info("User selected: Generate Weekly Goals")
     
     # Create a beautiful panel for the task
@@ -386,12 +1993,9 @@ def generate_weekly_goals():
     )
     console.print(panel)
     
-    # Simulate processing with a progress bar
     raw = process_csv_with_progress('redmine/timelog.csv')
-        
-        
-    time.sleep(1)
-    print_output(raw)
+    with progress_display() as progress, track_progress(progress, "Rendering weekly goals..."):
+        print_output(raw)
     # print_summary(tasks_this_week)
     
     # Success message
@@ -409,6 +2013,8 @@ def generate_weekly_goals():
 def eow_feature():
 
     """Handle weekly goals generation"""
+    from rich.panel import Panel
+
     logger.info("User selected: End of Week Summary")
     
     # Create a beautiful panel for the task
@@ -425,40 +2031,46 @@ def eow_feature():
     )
     console.print(panel)
     
-    # Simulate processing with a progress bar
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-        transient=True
-    ) as progress:
-        task = progress.add_task("Processing CSV files...", total=None)
-        df = read_csv_file('redmine/timelog.csv')
-        time.sleep(1)  
-        progress.update(task, description="Extracting current week redmines")
-        tasks_this_week = extract_data_from_this_week(df)
-        time.sleep(1)
-        progress.update(task, description="Generating End of Week Summary...")
+    with progress_display() as progress, track_progress(progress, "Processing CSV files..."):
+        tasks_this_week = load_this_week('redmine/timelog.csv')
+        progress_stage("Generating End of Week Summary...")
         print_eow_summary(tasks_this_week)
 
 def process_csv_with_progress(csv_path, description="Processing CSV files..."):
     """Process CSV file with progress bar"""
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-        transient=True
-    ) as progress:
-        task = progress.add_task(description, total=None)
-        df = read_csv_file(csv_path)
-        time.sleep(1)
-        progress.update(task, description="Generating weekly goals...")
-        tasks_this_week = extract_data_from_this_week(df)
-        raw = process_data(tasks_this_week)
-        time.sleep(1)
-        return raw
+    with progress_display() as progress, track_progress(progress, description):
+        tasks_this_week = load_this_week(csv_path)
+        return process_data(tasks_this_week)
+
+
+def process_csvs_with_progress(csv_paths):
+    """Load and process several exports at once under a single progress display
+
+    Each export gets its own thread and progress row; the results come back
+    in the order of csv_paths, so wall time is that of the slowest export.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    with progress_display() as progress:
+        def load(csv_path):
+            with track_progress(progress, f"Processing {csv_path}..."):
+                raw = process_data(load_this_week(csv_path))
+                progress_stage(f"[green]Done: {csv_path}[/green]")
+            return raw
+
+        _ensure_loaded()
+        with ThreadPoolExecutor(max_workers=len(csv_paths)) as pool:
+            return list(pool.map(load, csv_paths))
+
+
+# Compare reports built from more rows than this go to REPORTS_DIR instead of the console
+CONSOLE_REPORT_MAX_ROWS = 20_000
+REPORTS_DIR = 'reports'
+
+
 def compare_feature():
     """Handle compare feature"""
+    from rich.panel import Panel
 
     
     
@@ -477,17 +2089,35 @@ def compare_feature():
     )
     console.print(panel)
     
-    # Simulate processing with a progress bar
-    raw1 = process_csv_with_progress('redmine/timelog.csv')
-    raw2 = process_csv_with_progress('redmine/issues.csv')
-        
-        
+    # Both exports load side by side under one progress display
+    raw1, raw2 = process_csvs_with_progress(['redmine/timelog.csv', 'redmine/issues.csv'])
+
+    rows = sum(len(day) for raw in (raw1, raw2) for _, day in raw.values())
+    if rows > CONSOLE_REPORT_MAX_ROWS:
+        # Too big for the console and clipboard: stream it to a file, show the summary
+        iso_year, iso_week = current_iso_week()
+        path = os.path.join(REPORTS_DIR, f"compare-{iso_year}-W{iso_week:02d}.txt")
+        os.makedirs(REPORTS_DIR, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            with progress_display() as progress, track_progress(progress, "Rendering weekly goals..."):
+                day_counts = stream_weekly_goals([raw1, raw2], f)
+        print_goals_summary(day_counts, path)
+        return
 
     raw = merge_raws(raw1, raw2)
-    print_output(raw)
+    with progress_display() as progress, track_progress(progress, "Rendering weekly goals..."):
+        print_output(raw)
+
+def clear_cache_feature():
+    """Handle clearing the parsed export cache"""
+    logger.info("User selected: Clear Cache")
+    exports, indexes = clear_cache()
+    console.print(f"[green]🧹 Removed {exports} cached export(s) and {indexes} week index(es) from {CACHE_DIR}[/green]")
 
 def quit_application():
     """Handle application exit"""
+    from rich.panel import Panel
+
     logger.info("User chose to quit application")
     
     # Create a goodbye panel
@@ -503,6 +2133,11 @@ def quit_application():
 
 def display_menu():
     """Display a beautiful menu using Rich components"""
+    from rich import box
+    from rich.align import Align
+    from rich.panel import Panel
+    from rich.table import Table
+
     # Create a table for the menu
     table = Table(
         title="[bold magenta]🎯 MAIN MENU[/bold magenta]",
@@ -521,6 +2156,7 @@ def display_menu():
     table.add_row("2", "🔍 Compare", "✅ Ready")
     table.add_row("3", "📈 End of Week Summary", "✅ Ready")
     table.add_row("4", "🚪 Quit", "✅ Ready")
+    table.add_row("5", "🧹 Clear Cache", "✅ Ready")
     
     # Create a panel around the table
     menu_panel = Panel(
@@ -535,11 +2171,15 @@ def display_menu():
 
 def get_user_choice() -> Optional[Callable]:
     """Get and validate user input with improved error handling"""
+    from rich.panel import Panel
+    from rich.prompt import IntPrompt
+
     menu_options = {
         MenuChoice.GENERATE_WEEKLY_GOALS: ("Generate Weekly Goals", generate_weekly_goals),
         MenuChoice.COMPARE: ("Compare", compare_feature),
         MenuChoice.END_OF_WEEK_SUMMARY: ("EOW", eow_feature),
-        MenuChoice.QUIT: ("Quit", quit_application)
+        MenuChoice.QUIT: ("Quit", quit_application),
+        MenuChoice.CLEAR_CACHE: ("Clear Cache", clear_cache_feature)
     }
     
     while True:
@@ -550,7 +2190,7 @@ def get_user_choice() -> Optional[Callable]:
             # Get user input with Rich prompt
             choice_value = IntPrompt.ask(
                 "[bold cyan]Enter your choice[/bold cyan]",
-                choices=["1", "2", "3", "4"],
+                choices=["1", "2", "3", "4", "5"],
                 show_choices=True,
                 show_default=False
             )
@@ -580,8 +2220,637 @@ def get_user_choice() -> Optional[Callable]:
             console.print(error_panel)
             logger.error(f"Unexpected error in get_user_choice: {str(e)}")
 
+def goals_report(weeks, author=None, week=None):
+    """Weekly goals for a single export's week"""
+    return build_weekly_goals(process_data(weeks[0]), author, week)
+
+
+def compare_report(weeks, author=None, week=None):
+    """Weekly goals merged across every export's week"""
+    return build_weekly_goals(merge_raws(*[process_data(frame) for frame in weeks]), author, week)
+
+
+def eow_report(weeks, author=None, week=None):
+    """End of week summary for a single export's week"""
+    return build_eow_summary(weeks[0], author, week)
+
+
+BATCH_COMMANDS = {
+    'goals': (goals_report, ['redmine/timelog.csv'], "Generate weekly goals"),
+    'compare': (compare_report, ['redmine/timelog.csv', 'redmine/issues.csv'], "Merge exports into one weekly goals report"),
+    'eow': (eow_report, ['redmine/timelog.csv'], "Generate the end of week summary"),
+}
+
+
+# Seconds between checks when inotify is unavailable
+WATCH_INTERVAL = 1.0
+# Longest inotify wait before the watcher checks whether the ISO week changed
+WATCH_ROLLOVER_CHECK = 60.0
+IN_CLOSE_WRITE = 0x08
+IN_MOVED_TO = 0x80
+
+
+def _inotify_fd(directories):
+    """inotify descriptor watching directories for finished writes, or None"""
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        fd = libc.inotify_init1(os.O_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+    if fd < 0:
+        return None
+    for directory in directories:
+        if libc.inotify_add_watch(fd, os.fsencode(directory), IN_CLOSE_WRITE | IN_MOVED_TO) < 0:
+            os.close(fd)
+            return None
+    return fd
+
+
+def wait_for_changes(paths, interval=WATCH_INTERVAL, poll=False):
+    """Yield each time one of paths may have changed
+
+    Uses inotify where the platform has it and falls back to polling every
+    interval seconds; callers compare size and mtime to see what changed.
+    With inotify it also yields every WATCH_ROLLOVER_CHECK seconds, so
+    callers notice a new week on quiet exports.
+    """
+    fd = None if poll else _inotify_fd({os.path.dirname(os.path.abspath(path)) for path in paths})
+    if fd is None:
+        while True:
+            time.sleep(interval)
+            yield
+    try:
+        while True:
+            if not select.select([fd], [], [], WATCH_ROLLOVER_CHECK)[0]:
+                yield
+                continue
+            # Exporting often touches the file several times; settle, then drain the events
+            time.sleep(0.05)
+            while select.select([fd], [], [], 0)[0]:
+                os.read(fd, 64 * 1024)
+            yield
+    finally:
+        os.close(fd)
+
+
+class WeekWatcher:
+    """Keeps the current week of some exports in memory and folds in appended rows
+
+    Only the tail written since the last check is parsed, and only the days
+    whose rows changed are rendered again.
+    """
+
+    def __init__(self, command, inputs, author=None):
+        self.command = command
+        self.author = author
+        self.week = current_iso_week()
+        self.exports = {path: self._load(path) for path in inputs}
+        self.raw = None
+        self.blocks = {}
+        self.day_counts = {}
+        self._update_days()
+
+    def _load(self, path):
+        """Read an export's week rows and remember where the file ended"""
+        stat = os.stat(path)
+        rows, _ = _filter_this_week(load_week_rows(path))
+        # Appended rows are read with the encoding the index found for the
+        # whole export; without an index, a tail that fails to decode reloads it
+        index = update_week_index(path) if USE_WEEK_INDEX else None
+        if index is not None:
+            options = {'encoding': index['encoding'], 'encoding_errors': index.get('encoding_errors', 'strict')}
+        else:
+            options = _read_attempts(path)[0]
+        return {
+            'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, **options,
+            'columns': index['columns'] if index else list(pd.read_csv(path, nrows=0, **options).columns),
+            'head_hash': _hash_range(path, 0, FINGERPRINT_SAMPLE_BYTES),
+            'edge_hash': _edge_hash(path, stat.st_size),
+            'rows': rows.reset_index(drop=True),
+        }
+
+    def _weeks(self):
+        return [extract_data_from_this_week(state['rows'].copy()) for state in self.exports.values()]
+
+    def _update_days(self):
+        """Re-process the week and re-render the days whose rows changed"""
+        weeks = self._weeks()
+        if self.command == 'eow':
+            return []
+        raws = [process_data(week) for week in weeks]
+        raw = raws[0] if self.command == 'goals' else merge_raws(*raws)
+        changed = [key for key in WORKDAYS if self.raw is None or not _same_rendered_rows(self.raw[key][1], raw[key][1])]
+        for key in changed:
+            blocks, counts = render_day_blocks({key: raw[key]})
+            self.blocks[key] = blocks[key]
+            self.day_counts[key] = counts
+        self.raw = raw
+        return changed
+
+    def refresh(self):
+        """Fold in changed exports; returns the changed days, or None if nothing changed"""
+        week = reporting_clock(live=True)
+        if week != self.week:
+            # A new week began: its rows come from the whole exports, not their tails
+            self.week = week
+            self.exports = {path: self._load(path) for path in self.exports}
+            return self._update_days()
+        modified = False
+        for path, state in self.exports.items():
+            stat = os.stat(path)
+            if (stat.st_size, stat.st_mtime_ns) == (state['size'], state['mtime_ns']):
+                continue
+            modified = True
+            appended = None
+            if appended_since(path, state, stat):
+                try:
+                    appended = pd.concat(read_appended_rows(path, state))
+                except UnicodeDecodeError:
+                    # The new rows need another encoding; reload the whole export
+                    pass
+            if appended is not None:
+                rows, _ = _filter_this_week(appended)
+                state.update(
+                    size=stat.st_size, mtime_ns=stat.st_mtime_ns,
+                    edge_hash=_edge_hash(path, stat.st_size),
+                    # Old rows keep their positional labels, so unchanged days compare equal
+                    rows=apply_schema(pd.concat([state['rows'], rows], ignore_index=True)),
+                )
+            else:
+                self.exports[path] = self._load(path)
+        return self._update_days() if modified else None
+
+    def write(self, out):
+        """Write the full report from the cached day blocks"""
+        if self.command == 'eow':
+            render_eow_summary(self._weeks()[0], out, self.author)
+            return
+        counts = {level: sum(day[level] for day in self.day_counts.values()) for level in DIFFICULTY_LEVELS + ['TOTAL']}
+        write_weekly_goals([self.blocks[key] for key in WORKDAYS], counts, out, self.author)
+
+
+def _same_rendered_rows(before, after):
+    columns = ['Project', 'Issue', DIFFICULTY_COLUMN]
+    return before.reindex(columns=columns).astype(object).equals(after.reindex(columns=columns).astype(object))
+
+
+def watch_exports(command, inputs, out_path=None, interval=WATCH_INTERVAL, poll=False):
+    """Re-render a report whenever its exports change, until interrupted"""
+    watcher = WeekWatcher(command, inputs)
+
+    def publish():
+        if out_path:
+            with open(out_path, 'w', encoding='utf-8') as f:
+                watcher.write(f)
+        else:
+            with ReportWriter(to_clipboard=False) as writer:
+                watcher.write(writer)
+
+    publish()
+    console.print(f"[cyan]👀 Watching {', '.join(inputs)} (Ctrl+C to stop)[/cyan]")
+    try:
+        for _ in wait_for_changes(inputs, interval, poll):
+            start = time.perf_counter()
+            changed = watcher.refresh()
+            if changed is None:
+                continue
+            publish()
+            elapsed = (time.perf_counter() - start) * 1e3
+            days = 'summary' if command == 'eow' else ', '.join(key.name for key in changed) or 'no days'
+            console.print(f"[green]Refreshed {days} in {elapsed:.0f} ms[/green]")
+            logger.info(f"Watch refresh of {command}: {days} in {elapsed:.0f} ms")
+    except KeyboardInterrupt:
+        console.print("[yellow]Stopped watching[/yellow]")
+
+
+# Column naming the person a row belongs to: time entries first, then issues
+USER_COLUMNS = ['User', 'Assignee']
+
+
+def split_by_user(df):
+    """Map each user to their rows, using the first user column the export has"""
+    column = next((column for column in USER_COLUMNS if column in df.columns), None)
+    if column is None:
+        raise ValueError(f"Export has none of the user columns {USER_COLUMNS}")
+    return dict(iter(df.groupby(column, sort=True)))
+
+
+@traced
+def render_user_report(command, user_rows, author, week=None, fmt='text'):
+    """Render one user's report from their raw rows of each export; runs in a worker"""
+    out = StringIO()
+    weeks = [extract_data_from_this_week(rows, week) for rows in user_rows]
+    write_report(BATCH_COMMANDS[command][0](weeks, author, week), out, fmt)
+    return out.getvalue()
+
+
+# File extension of each report format in --by-user output directories
+REPORT_EXTENSIONS = {'text': '.txt', 'markdown': '.md', 'json': '.json', 'csv': '.csv'}
+
+
+def run_team(command, inputs, out_dir, workers=None, team=REPORT_TEAM, week=None, fmt='text'):
+    """Write one report per user to out_dir, rendering users across a process pool
+
+    Rows are split by user before deduping, so each report matches what the
+    single-user pipeline gives for an export holding only that user's rows.
+    """
+    # Forked workers inherit the modules; make sure they inherit them loaded
+    _ensure_loaded()
+    week_rows = [load_week_rows(path, week) for path in inputs]
+    per_user = {}
+    for position, rows in enumerate(week_rows):
+        for user, user_rows in split_by_user(rows).items():
+            frames = per_user.setdefault(user, [frame.iloc[:0] for frame in week_rows])
+            frames[position] = user_rows
+
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    os.makedirs(out_dir, exist_ok=True)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(render_user_report, command, frames, user_author(user, team), week, fmt): user
+            for user, frames in per_user.items()
+        }
+        for future in as_completed(futures):
+            user = futures[future]
+            file_name = re.sub(r'[^\w.-]+', '_', str(user)).strip('_') + REPORT_EXTENSIONS[fmt]
+            with open(os.path.join(out_dir, file_name), 'w', encoding='utf-8') as f:
+                f.write(future.result())
+            console.print(f"[green]Wrote report for {user}: {file_name}[/green]")
+    return sorted(per_user)
+
+
+# Local report server; bound to loopback so only this machine can ask
+SERVE_HOST = '127.0.0.1'
+SERVE_PORT = 8765
+# Week frames and rendered reports kept in memory, least recently used dropped first
+SERVE_CACHE_ENTRIES = 256
+
+
+def _remember(cache, key, value, limit=SERVE_CACHE_ENTRIES):
+    cache[key] = value
+    cache.move_to_end(key)
+    if len(cache) > limit:
+        cache.popitem(last=False)
+    return value
+
+
+class ReportService:
+    """Keeps exports parsed and week frames filtered in memory and memoizes rendered reports
+
+    Reports are memoized per (command, export fingerprints, week, user). Each
+    request stats the exports it needs; a file whose size or mtime changed is
+    parsed again and everything derived from its old fingerprint is dropped.
+    """
+
+    def __init__(self, paths):
+        from collections import OrderedDict
+
+        # Exports each command reads, in the order its report expects them
+        self.paths = paths
+        self.exports = {}
+        self.week_frames = OrderedDict()
+        # Report models, so every format of a report comes from one computation
+        self.results = OrderedDict()
+
+    def export(self, path):
+        """Fingerprint and parsed frame of an export, parsing it again only when it changed"""
+        stat = os.stat(path)
+        cached = self.exports.get(path)
+        if cached and cached[0] == (stat.st_size, stat.st_mtime_ns):
+            return cached[1], cached[2]
+        if cached:
+            self._forget(cached[1])
+        df = read_csv_file(path)
+        if df is None:
+            raise ValueError(f"Could not read {path}")
+        fingerprint = file_fingerprint(path)
+        self.exports[path] = ((stat.st_size, stat.st_mtime_ns), fingerprint, df)
+        return fingerprint, df
+
+    def _forget(self, fingerprint):
+        for key in [key for key in self.week_frames if key[0] == fingerprint]:
+            del self.week_frames[key]
+        for key in [key for key in self.results if fingerprint in key[1]]:
+            del self.results[key]
+
+    def week_frame(self, path, week, user=None):
+        fingerprint, df = self.export(path)
+        key = (fingerprint, week, user)
+        if key in self.week_frames:
+            self.week_frames.move_to_end(key)
+            return fingerprint, self.week_frames[key]
+        if user is not None:
+            column = next((column for column in USER_COLUMNS if column in df.columns), None)
+            df = df[df[column] == user] if column else df.iloc[:0]
+        return fingerprint, _remember(self.week_frames, key, extract_data_from_this_week(df, week))
+
+    def report(self, command, week, user=None):
+        """Report model and whether it was served from the memo"""
+        frames = [self.week_frame(path, week, user) for path in self.paths[command]]
+        key = (command, tuple(fingerprint for fingerprint, _ in frames), week, user)
+        if key in self.results:
+            self.results.move_to_end(key)
+            return self.results[key], True
+        # Report stages add columns to their frames, so the warm ones get copies
+        report = BATCH_COMMANDS[command][0]([frame.copy() for _, frame in frames], user_author(user), week=week)
+        return _remember(self.results, key, report), False
+
+
+CONTENT_TYPES = {'text': 'text/plain', 'markdown': 'text/markdown', 'json': 'application/json', 'csv': 'text/csv'}
+HTTP_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 500: 'Internal Server Error'}
+
+
+def _serve_request(service, request_line):
+    """Answer one request line with (status, content type, body)
+
+    GET /<goals|compare|eow>?week=2025-W32&user=Name&format=text|markdown|json|csv
+    GET /health
+    """
+    from urllib.parse import parse_qs, urlsplit
+
+    parts = request_line.split()
+    if len(parts) < 2:
+        return 400, 'text/plain', "Malformed request\n"
+    method, target = parts[0], parts[1]
+    if method != 'GET':
+        return 405, 'text/plain', "Only GET is supported\n"
+    url = urlsplit(target)
+    command = url.path.strip('/')
+    if command == 'health':
+        return 200, 'text/plain', "ok\n"
+    if command not in BATCH_COMMANDS:
+        return 404, 'text/plain', f"Unknown report {command!r}; try {', '.join(BATCH_COMMANDS)}\n"
+
+    query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+    try:
+        week = parse_week(query['week']) if 'week' in query else reporting_clock(live=True)
+    except ValueError as e:
+        return 400, 'text/plain', f"{e}\n"
+    user = query.get('user')
+    fmt = query.get('format', 'text')
+    if fmt not in REPORT_FORMATS:
+        return 400, 'text/plain', f"format must be one of {', '.join(REPORT_FORMATS)}\n"
+
+    start = time.perf_counter()
+    report, cached = service.report(command, week, user)
+    if fmt == 'json':
+        body = json.dumps({'command': command, 'user': user, 'cached': cached, 'report': report.to_dict()},
+                          ensure_ascii=False)
+    else:
+        out = StringIO()
+        write_report(report, out, fmt)
+        body = out.getvalue()
+    elapsed = (time.perf_counter() - start) * 1e3
+    logger.info(f"Served {command} week {week[0]}-W{week[1]:02d} user={user} "
+                f"({'cached' if cached else 'rendered'}, {elapsed:.1f} ms)")
+    return 200, CONTENT_TYPES[fmt], body
+
+
+async def _handle_connection(service, lock, reader, writer):
+    import asyncio
+
+    try:
+        request_line = (await reader.readline()).decode('latin-1')
+        # Headers are read and ignored; no endpoint takes a body
+        while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+            pass
+        # Rendering is CPU bound, so it runs off the event loop one request at a time
+        async with lock:
+            status, content_type, body = await asyncio.to_thread(_serve_request, service, request_line)
+    except Exception as e:
+        logger.error(f"Report request failed: {str(e)}")
+        status, content_type, body = 500, 'text/plain', f"{e}\n"
+    payload = body.encode('utf-8')
+    writer.write(
+        f"HTTP/1.1 {status} {HTTP_REASONS[status]}\r\n"
+        f"Content-Type: {content_type}; charset=utf-8\r\n"
+        f"Content-Length: {len(payload)}\r\nConnection: close\r\n\r\n".encode('latin-1') + payload
+    )
+    try:
+        await writer.drain()
+    finally:
+        writer.close()
+
+
+def serve_reports(paths, host=SERVE_HOST, port=SERVE_PORT):
+    """Serve reports over HTTP from warm frames until interrupted"""
+    import asyncio
+
+    # Requests are answered on worker threads
+    _ensure_loaded()
+    service = ReportService(paths)
+    # Parse every export and render this week's reports up front
+    for command in paths:
+        service.report(command, reporting_clock(live=True))
+
+    async def run():
+        lock = asyncio.Lock()
+        server = await asyncio.start_server(
+            lambda reader, writer: _handle_connection(service, lock, reader, writer), host, port)
+        console.print(f"[cyan]📡 Serving {', '.join(paths)} on http://{host}:{port} (Ctrl+C to stop)[/cyan]")
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        console.print("[yellow]Stopped serving[/yellow]")
+
+
+def build_parser():
+    """Command line for the headless batch mode; no command starts the menu"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Goal Manager: weekly goals and EOW summaries from Redmine exports")
+    parser.add_argument('--trace', action='store_true', help=f"Record per-stage timings, rows and memory in {TRACE_PATH}")
+    parser.add_argument('--profile', action='store_true', help="Like --trace, plus a cProfile and tracemalloc dump per run")
+    commands = parser.add_subparsers(dest='command')
+    for name, (_, defaults, summary) in BATCH_COMMANDS.items():
+        command = commands.add_parser(name, help=summary)
+        command.add_argument('--input', action='append', metavar='CSV',
+                             help=f"Redmine export to read (default: {' '.join(defaults)})")
+        command.add_argument('--out', metavar='PATH', help="Write the report here instead of stdout")
+        command.add_argument('--quiet', action='store_true', help="Only print errors on stderr")
+        command.add_argument('--by-user', action='store_true',
+                             help="Write one report per user into the --out directory (default: reports)")
+        command.add_argument('--workers', type=int, help="Worker processes for --by-user (default: CPU count)")
+        command.add_argument('--team', default=REPORT_TEAM, help=f"Team shown in --by-user headers (default: {REPORT_TEAM})")
+        command.add_argument('--user', help="Only report rows of this User/Assignee")
+        period = command.add_mutually_exclusive_group()
+        period.add_argument('--week', type=parse_week, help="ISO week to report, e.g. 2025-W32 (default: this week)")
+        period.add_argument('--from', dest='first_week', type=parse_week, metavar='WEEK',
+                            help="First ISO week of a range ending at --to (default: this week)")
+        period.add_argument('--month', help="Every ISO week of a month, e.g. 2025-08")
+        period.add_argument('--quarter', help="Every ISO week of a quarter, e.g. 2025-Q3")
+        command.add_argument('--to', dest='last_week', type=parse_week, metavar='WEEK', help="Last ISO week of a --from range")
+        command.add_argument('--format', choices=list(REPORT_FORMATS), default='text',
+                             help="Report format (default: the Slack-style text)")
+        if name == 'compare':
+            command.add_argument('--summary-only', action='store_true',
+                                 help="Show only per-day counts of one week on the console; the report goes to --out alone")
+        command.add_argument('--db', metavar='PATH', nargs='?', const=STORE_PATH,
+                             help=f"Read rows from the ingested store instead of the exports (default: {STORE_PATH})")
+    commands.add_parser('clear-cache', help="Remove every cached export")
+
+    serve = commands.add_parser('serve', help="Serve reports over local HTTP from warm, memoized frames")
+    serve.add_argument('--host', default=SERVE_HOST, help=f"Address to listen on (default: {SERVE_HOST})")
+    serve.add_argument('--port', type=int, default=SERVE_PORT, help=f"Port to listen on (default: {SERVE_PORT})")
+    serve.add_argument('--timelog', default='redmine/timelog.csv', help="Timelog export (default: redmine/timelog.csv)")
+    serve.add_argument('--issues', default='redmine/issues.csv', help="Issue export (default: redmine/issues.csv)")
+
+    ingest = commands.add_parser('ingest', help="Upsert exports into the local store read by --db")
+    ingest.add_argument('--input', action='append', metavar='CSV',
+                        help="Redmine export to ingest (default: redmine/timelog.csv redmine/issues.csv)")
+    ingest.add_argument('--db', metavar='PATH', default=STORE_PATH, help=f"Store to upsert into (default: {STORE_PATH})")
+
+    watch = commands.add_parser('watch', help="Re-render a report whenever its exports change")
+    watch.add_argument('report', choices=list(BATCH_COMMANDS), help="Report to keep up to date")
+    watch.add_argument('--input', action='append', metavar='CSV', help="Redmine export to watch (default: as for the report)")
+    watch.add_argument('--out', metavar='PATH', help="Rewrite the report here instead of printing it")
+    watch.add_argument('--interval', type=float, default=WATCH_INTERVAL,
+                       help=f"Seconds between checks when polling (default: {WATCH_INTERVAL})")
+    watch.add_argument('--poll', action='store_true', help="Poll mtimes even where inotify is available")
+    return parser
+
+
+def resolve_weeks(args):
+    """ISO weeks selected on the command line, or None for the current week"""
+    if args.week:
+        return [args.week]
+    if args.first_week:
+        return weeks_between(args.first_week, args.last_week or current_iso_week())
+    if args.month:
+        year, month = (int(part) for part in args.month.split('-'))
+        return month_weeks(year, month)
+    if args.quarter:
+        year, quarter = args.quarter.upper().split('-Q')
+        return quarter_weeks(int(year), int(quarter))
+    return None
+
+
+def run_range(command, inputs, out, weeks, user=None, db_path=None, fmt='text', author=None):
+    """Reports spanning several weeks
+
+    Weekly goals are written week after week; the end of week summary is
+    aggregated over the whole range from the export's rollup table, or from
+    the store's rows of those weeks when db_path is given.
+    """
+    if command == 'eow':
+        rollup = build_rollup(query_store('timelog', weeks, user, db_path)) if db_path else load_rollup(inputs[0])
+        counts, _ = rollup_difficulty(rollup, weeks, user)
+        write_report(EowSummary(counts, author, week=weeks[0], last_week=weeks[-1]), out, fmt)
+        return
+    func = BATCH_COMMANDS[command][0]
+    for position, week in enumerate(weeks):
+        if position and fmt == 'text':
+            out.write("\n")
+        if db_path:
+            frames = store_report_frames(command, week, user, db_path)
+        else:
+            frames = load_report_frames(inputs, week, user)
+        write_report(func(frames, author, week=week), out, fmt)
+
+
+def run_ingest(inputs, db_path=STORE_PATH):
+    """Ingest every export into the store, reporting what changed"""
+    for path in inputs:
+        kind, rows, changed, removed = ingest_export(path, db_path)
+        console.print(f"[green]Ingested {path} as {kind}: {rows} rows, {changed} new or changed, {removed} removed[/green]")
+        logger.info(f"Ingested {path} into {db_path}: {rows} rows, {changed} new or changed, {removed} removed")
+
+
+def run_batch(args):
+    """Run one report without the menu, spinner, sleeps or clipboard"""
+    if args.command == 'watch':
+        logger.info(f"Watching exports for: {args.report}")
+        watch_exports(args.report, args.input or BATCH_COMMANDS[args.report][1], args.out, args.interval, args.poll)
+        return 0
+
+    # Status messages go to stderr so stdout carries nothing but the report
+    console.file = sys.stderr
+    if args.command == 'clear-cache':
+        exports, indexes = clear_cache()
+        console.print(f"Removed {exports} cached export(s) and {indexes} week index(es) from {CACHE_DIR}")
+        return 0
+    if args.command == 'serve':
+        exports = {'timelog': args.timelog, 'issues': args.issues}
+        serve_reports({command: [exports[kind] for kind in kinds] for command, kinds in STORE_KINDS.items()},
+                      args.host, args.port)
+        return 0
+    if args.command == 'ingest':
+        try:
+            run_ingest(args.input or ['redmine/timelog.csv', 'redmine/issues.csv'], args.db)
+        except Exception as e:
+            logger.error(f"Ingest failed: {str(e)}")
+            return 1
+        return 0
+
+    console.quiet = args.quiet
+    if args.quiet:
+        # INFO records still reach menu_app.log
+        _log_stream.setLevel(logging.WARNING)
+    func, defaults, _ = BATCH_COMMANDS[args.command]
+    logger.info(f"Batch command: {args.command}")
+    inputs = args.input or defaults
+    try:
+        with trace_run(args.command):
+            weeks = resolve_weeks(args)
+            if args.by_user:
+                if weeks and len(weeks) > 1:
+                    raise ValueError("--by-user reports one week at a time; use --week")
+                if args.db:
+                    raise ValueError("--by-user reads the exports; drop --db")
+                run_team(args.command, inputs, args.out or 'reports', args.workers, args.team, weeks and weeks[0],
+                         args.format)
+                return 0
+
+            summary_only = getattr(args, 'summary_only', False)
+            if summary_only and weeks and len(weeks) > 1:
+                raise ValueError("--summary-only shows one week; use --week")
+
+            if args.out:
+                out = open(args.out, 'w', encoding='utf-8')
+            elif summary_only:
+                out = open(os.devnull, 'w', encoding='utf-8')
+            else:
+                out = sys.stdout
+            author = user_author(args.user, args.team)
+            try:
+                if weeks and len(weeks) > 1:
+                    run_range(args.command, inputs, out, weeks, args.user, args.db, args.format, author)
+                else:
+                    week = weeks and weeks[0]
+                    if args.db:
+                        frames = store_report_frames(args.command, week, args.user, args.db)
+                    else:
+                        frames = load_report_frames(inputs, week, args.user)
+                    if args.command == 'compare' and args.format == 'text':
+                        # Written day by day as the exports are merged
+                        day_counts = stream_weekly_goals([process_data(frame) for frame in frames], out, author, week)
+                        if summary_only:
+                            print_goals_summary(day_counts, args.out)
+                    else:
+                        report = func(frames, author, week=week)
+                        write_report(report, out, args.format)
+                        if summary_only:
+                            print_goals_summary(report.day_counts(), args.out)
+            finally:
+                if out is not sys.stdout:
+                    out.close()
+    except Exception as e:
+        logger.error(f"Batch command {args.command} failed: {str(e)}")
+        return 1
+    return 0
+
+
 def main():
     """Main application loop"""
+    from rich.align import Align
+    from rich.panel import Panel
+    from rich.prompt import Prompt
+    from rich.text import Text
+
     logger.info("Application started")
     
     # Display welcome banner
@@ -602,7 +2871,10 @@ def main():
             if selected_function:
                 try:
                     # Execute the selected function
-                    result = selected_function()
+                    with trace_run(selected_function.__name__):
+                        # A session can stay open across a week boundary
+                        reporting_clock(live=True)
+                        result = selected_function()
                     
                     # If the function returns False, exit the loop (quit option)
                     if result is False:
@@ -649,4 +2921,14 @@ def main():
         console.print("[dim]Application closed.[/dim]")
 
 if __name__ == "__main__":
+    # argparse is only loaded when there is a command line to parse
+    if len(sys.argv) > 1:
+        parser = build_parser()
+        args = parser.parse_args()
+        if getattr(args, 'last_week', None) and not args.first_week:
+            parser.error("--to ends a --from range; use --from with it, or --week for one week")
+        if args.trace or args.profile:
+            enable_tracing(profile=args.profile)
+        if args.command:
+            sys.exit(run_batch(args))
     main()
\ No newline at end of file